@@ -36,6 +36,10 @@ setup(
         "PyYAML",
         "setuptools"
     ],
+    extras_require={
+        # Runs the advanced pain detector's model on ONNX Runtime on CPU
+        "onnx": ["optimum[onnxruntime]"],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
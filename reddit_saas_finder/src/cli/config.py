@@ -2,19 +2,17 @@
 import typer
 from rich.console import Console
 from rich.syntax import Syntax
-import yaml
-from utils.config import ConfigManager
+from utils.config import get_config_manager
 
 app = typer.Typer(help="Manage application configuration.")
 console = Console()
-config_manager = ConfigManager()
 
 @app.command()
 def show():
     """
     Displays the contents of all loaded YAML configuration files.
     """
-    raw_main, raw_subreddits = config_manager.get_raw_config_text()
+    raw_main, raw_subreddits = get_config_manager().get_raw_config_text()
 
     console.print("\n[bold cyan]Note: Configuration is loaded from within the installed package.[/bold cyan]")
     console.print("[cyan]To make changes, you may need to reinstall the package after editing the source files.[/cyan]")
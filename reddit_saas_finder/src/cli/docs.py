@@ -1,6 +1,8 @@
 import typer
 import subprocess
 import os
+import shutil
+import tempfile
 from rich.console import Console
 import sys
 
@@ -12,6 +14,7 @@ def build(
     ctx: typer.Context,
     clean: bool = typer.Option(False, "--clean", "-c", help="Clean the build directory before building."),
     browse: bool = typer.Option(False, "--browse", "-b", help="Open the documentation in a browser after building."),
+    jobs: str = typer.Option("auto", "--jobs", "-j", help="Number of parallel Sphinx workers, or 'auto' for one per CPU."),
 ):
     """
     Build the HTML documentation using Sphinx.
@@ -20,40 +23,42 @@ def build(
     source_dir = os.path.join(docs_dir, "source")
     build_dir = os.path.join(docs_dir, "api")
 
-    if clean:
+    if clean and os.path.isdir(build_dir):
         console.print(f"Cleaning build directory: {build_dir}")
-        subprocess.run(["rm", "-rf", build_dir], check=True)
+        shutil.rmtree(build_dir, ignore_errors=True)
 
     console.print("Building documentation...")
+    # We need to use the venv sphinx-build
+    venv_path = os.path.dirname(sys.executable)
     cmd = [
-        "sphinx-build",
+        os.path.join(venv_path, "sphinx-build"),
+        "-j", jobs,
         "-b", "html",
         source_dir,
         build_dir
     ]
     
-    try:
-        # We need to use the venv sphinx-build
-        venv_path = os.path.dirname(sys.executable)
-        cmd[0] = os.path.join(venv_path, cmd[0])
+    # Sphinx's progress goes straight to the terminal; only stderr is kept,
+    # in a temporary file, so it can be shown if the build fails.
+    with tempfile.TemporaryFile(mode="w+") as stderr_file:
+        try:
+            subprocess.run(cmd, check=True, stderr=stderr_file)
+            console.print(f"[bold green]Documentation built successfully.[/bold green]")
+            console.print(f"You can find the documentation in: {os.path.abspath(build_dir)}/index.html")
 
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        console.print(result.stdout)
-        console.print(f"[bold green]Documentation built successfully.[/bold green]")
-        console.print(f"You can find the documentation in: {os.path.abspath(build_dir)}/index.html")
+            if browse:
+                import webbrowser
+                webbrowser.open(f"file://{os.path.abspath(build_dir)}/index.html")
 
-        if browse:
-            import webbrowser
-            webbrowser.open(f"file://{os.path.abspath(build_dir)}/index.html")
-
-    except subprocess.CalledProcessError as e:
-        console.print(f"[bold red]Error building documentation:[/bold red]")
-        console.print(e.stderr)
-        raise typer.Exit(code=1)
-    except FileNotFoundError:
-        console.print("[bold red]Error: 'sphinx-build' command not found.[/bold red]")
-        console.print("Please ensure Sphinx is installed in your environment.")
-        raise typer.Exit(code=1)
+        except subprocess.CalledProcessError:
+            stderr_file.seek(0)
+            console.print(f"[bold red]Error building documentation:[/bold red]")
+            console.print(stderr_file.read())
+            raise typer.Exit(code=1)
+        except FileNotFoundError:
+            console.print("[bold red]Error: 'sphinx-build' command not found.[/bold red]")
+            console.print("Please ensure Sphinx is installed in your environment.")
+            raise typer.Exit(code=1)
 
 if __name__ == "__main__":
     app() 
\ No newline at end of file
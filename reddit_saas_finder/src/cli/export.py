@@ -1,32 +1,44 @@
 """Handles the CLI commands for exporting data and generating reports."""
+import functools
+
 import typer
-from rich import print
-from utils.export import DataExporter
-from data.database import get_opportunities, get_pain_points
+from utils.formatters import echo
 from typing_extensions import Annotated
 
-exporter = DataExporter(export_dir="reddit_saas_finder/exports")
+@functools.lru_cache(maxsize=None)
+def get_exporter():
+    """Returns the DataExporter used by the export commands, importing it on first use."""
+    from utils.export import DataExporter
+    return DataExporter(export_dir="reddit_saas_finder/exports")
 
 def export(
     opportunities: Annotated[bool, typer.Option("--opportunities", help="Export opportunities data.")] = False,
     pain_points: Annotated[bool, typer.Option("--pain-points", help="Export pain points data.")] = False,
-    format: Annotated[str, typer.Option("--format", "-f", help="Export format (csv, json, yaml).")] = "csv",
+    format: Annotated[str, typer.Option("--format", "-f", help="Export format (csv, json, ndjson, yaml).")] = "csv",
     output: Annotated[str, typer.Option("--output", "-o", help="The name of the output file.")] = None,
+    compress: Annotated[bool, typer.Option("--compress", "-z", help="Gzip the exported file.")] = False,
 ):
     """
     Exports generated data to various file formats.
     """
     if not opportunities and not pain_points:
-        print("[bold red]Error: Please specify what to export, e.g., --opportunities or --pain-points[/bold red]")
+        echo("[bold red]Error: Please specify what to export, e.g., --opportunities or --pain-points[/bold red]")
         raise typer.Exit(code=1)
 
+    from data.database import iter_opportunities, iter_pain_points, get_opportunity_count, get_pain_point_count
+
+    exporter = get_exporter()
+
     if opportunities:
-        data_to_export = get_opportunities(limit=1000)
-        exporter.export_data(data_to_export, 'opportunities', format, output)
+        data_to_export = iter_opportunities(limit=1000)
+        # The row count lets large YAML exports fall back to NDJSON.
+        row_count = min(get_opportunity_count(), 1000) if format == 'yaml' else None
+        exporter.export_data(data_to_export, 'opportunities', format, output, compress, row_count)
 
     if pain_points:
-        data_to_export = get_pain_points()
-        exporter.export_data(data_to_export, 'pain_points', format, output)
+        data_to_export = iter_pain_points()
+        row_count = get_pain_point_count() if format == 'yaml' else None
+        exporter.export_data(data_to_export, 'pain_points', format, output, compress, row_count)
 
 def report(
     summary: Annotated[bool, typer.Option("--summary", help="Generate a summary report (default).")] = True,
@@ -38,6 +50,6 @@ def report(
     Generates a summary report of the analysis findings.
     """
     if comprehensive:
-        print("[bold yellow]Warning: Comprehensive report is not yet implemented. Generating a summary report instead.[/bold yellow]")
+        echo("[bold yellow]Warning: Comprehensive report is not yet implemented. Generating a summary report instead.[/bold yellow]")
     
-    exporter.generate_report(format, output) 
\ No newline at end of file
+    get_exporter().generate_report(format, output) 
\ No newline at end of file
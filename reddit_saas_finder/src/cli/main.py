@@ -1,20 +1,78 @@
+import importlib
+
 import typer
-from rich.console import Console
-from data.database import initialize_database, get_db_connection
-from cli.scraper import app as scraper_app
-from cli.processor import process
-from cli.opportunities import opportunities_app
-from cli.export import export, report
-from cli import docs as docs_cli
-from cli import config as config_cli
-from cli import trends as trends_cli
+from typer.core import TyperCommand, TyperGroup
+
+from utils.formatters import get_console
+
+# Subcommands are imported only when they are dispatched, so `--help` and
+# unrelated commands don't pay for pandas, spaCy or transformers.
+# Maps command name -> (module path, attribute, short help).
+LAZY_SUBCOMMANDS = {
+    "scrape": ("cli.scraper", "app", "Scrape posts and comments from Reddit."),
+    "process": ("cli.processor", "process", "Processes unprocessed data to find pain points."),
+    "process-worker": ("cli.processor", "serve", "Keeps the pain point detector loaded for later process runs."),
+    "export": ("cli.export", "export", "Exports generated data to various file formats."),
+    "report": ("cli.export", "report", "Generates a summary report of the analysis findings."),
+    "opportunities": ("cli.opportunities", "opportunities_app", "Generate, show and recommend SaaS opportunities."),
+    "docs": ("cli.docs", "app", "Build the HTML documentation."),
+    "config": ("cli.config", "app", "Manage application configuration."),
+    "trends": ("cli.trends", "app", "Commands for trend detection and analysis."),
+    "show": ("cli.visualization", "app", "Visualize opportunities in the terminal."),
+    "keywords": ("cli.keywords", "app", "Manage custom keywords for NLP processing."),
+    "validate": ("cli.validator", "app", "Commands for data validation and quality checks."),
+    "optimize": ("cli.optimizer", "app", "Commands for performance optimization."),
+    "schedule": ("cli.scheduler", "app", "Commands for scheduling scraping and processing tasks."),
+}
+
+
+class LazyGroup(TyperGroup):
+    """
+    A Typer group that resolves the subcommands in `LAZY_SUBCOMMANDS` on first access.
+
+    While the help page is being rendered, lightweight placeholder commands are
+    returned instead so that listing the commands does not import their modules.
+    """
+    _listing = False
+
+    def list_commands(self, ctx):
+        names = super().list_commands(ctx)
+        return names + [name for name in LAZY_SUBCOMMANDS if name not in names]
+
+    def get_command(self, ctx, cmd_name):
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in LAZY_SUBCOMMANDS:
+            return command
+
+        module_path, attr, short_help = LAZY_SUBCOMMANDS[cmd_name]
+        if self._listing:
+            return TyperCommand(name=cmd_name, help=short_help)
+
+        target = getattr(importlib.import_module(module_path), attr)
+        if isinstance(target, typer.Typer):
+            command = typer.main.get_group(target)
+        else:
+            single = typer.Typer(add_completion=False)
+            single.command(cmd_name)(target)
+            command = typer.main.get_command(single)
+        command.name = cmd_name
+        self.add_command(command, cmd_name)
+        return command
+
+    def format_help(self, ctx, formatter):
+        self._listing = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._listing = False
+
 
 # Main Typer app
 app = typer.Typer(
     name="reddit-finder",
-    help="A CLI tool to find SaaS opportunities on Reddit."
+    help="A CLI tool to find SaaS opportunities on Reddit.",
+    cls=LazyGroup
 )
-console = Console()
 
 def export_opportunities_command(
     format: str = typer.Option("csv", "--format", "-f", help="Export format (csv, json)."),
@@ -22,36 +80,40 @@ def export_opportunities_command(
 ):
     """Exports all opportunities to a file."""
     from utils.export import DataExporter
-    from data.database import get_opportunities
+    from data.database import iter_opportunities
     exporter = DataExporter(export_dir="exports")
-    data_to_export = get_opportunities(limit=1000)
+    data_to_export = iter_opportunities(limit=1000)
     exporter.export_data(data_to_export, 'opportunities', format, output)
 
-# Add subcommands from other modules
-app.add_typer(scraper_app, name="scrape")
-app.command()(process)
-app.command()(export)
 app.command("export-opportunities")(export_opportunities_command)
-app.command()(report)
-app.add_typer(opportunities_app, name="opportunities")
-app.add_typer(docs_cli.app, name="docs")
-app.add_typer(config_cli.app, name="config")
-app.add_typer(trends_cli.app, name="trends")
 
 
 @app.callback()
-def main_callback():
+def main_callback(
+    ctx: typer.Context,
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Suppress start-up messages, e.g. for scripts and cron jobs.")
+):
     """
-    Initializes the database before running any command.
+    Initializes the database before running any command, if its schema is out of date.
+
+    The connection opened here is shared by the command's database calls and
+    closed when the command finishes.
     """
-    console.print("[bold cyan]Initializing application...[/bold cyan]")
+    from data.database import initialize_database, use_shared_connection, schema_is_current
+
+    # Commands can read the global options from ctx.obj
+    ctx.obj = {"quiet": quiet}
     try:
-        conn = get_db_connection()
-        initialize_database(conn)
-        conn.close()
-        console.print("[bold green]Database initialized successfully.[/bold green]")
+        conn = ctx.with_resource(use_shared_connection())
+        # Only a new or outdated database pays for the schema DDL.
+        if not schema_is_current(conn):
+            if not quiet:
+                get_console().print("[bold cyan]Initializing application...[/bold cyan]")
+            initialize_database(conn, quiet=quiet)
+            if not quiet:
+                get_console().print("[bold green]Database initialized successfully.[/bold green]")
     except Exception as e:
-        console.print(f"[bold red]Error during database initialization: {e}[/bold red]")
+        get_console().print(f"[bold red]Error during database initialization: {e}[/bold red]")
 
 if __name__ == "__main__":
-    app() 
\ No newline at end of file
+    app()
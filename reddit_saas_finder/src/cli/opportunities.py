@@ -1,12 +1,14 @@
 """Handles opportunity generation and scoring."""
+import contextlib
+import json
+import sys
+
 import typer
-from rich.console import Console
-from ml.opportunity_scorer import OpportunityScorer
-from data.database import get_pain_points, save_opportunities, Opportunity as OpportunityDB, get_opportunities
+from data.database import get_pain_points, save_opportunities, get_opportunities, get_opportunities_rows
 from rich.table import Table
+from utils.formatters import get_console
 
 opportunities_app = typer.Typer()
-console = Console()
 
 @opportunities_app.command()
 def generate(
@@ -17,51 +19,87 @@ def generate(
     """
     Analyzes detected pain points to generate and score potential SaaS opportunities.
     """
-    console.print("[bold green]Generating SaaS opportunities...[/bold green]")
+    # The scorer pulls in scikit-learn and spaCy, which `show` and `recommend` don't need
+    from ml.opportunity_scorer import OpportunityScorer
+
+    get_console().print("[bold green]Generating SaaS opportunities...[/bold green]")
     try:
-        pain_points = get_pain_points()
+        pain_points = get_pain_points(columns=OpportunityScorer.PAIN_POINT_COLUMNS)
         if not pain_points:
-            console.print("[yellow]No pain points found to analyze. Run the 'process' command first.[/yellow]")
+            get_console().print("[yellow]No pain points found to analyze. Run the 'process' command first.[/yellow]")
             return
 
         scorer = OpportunityScorer(pain_points, min_pain_points, min_score, similarity)
         opportunities = scorer.generate_opportunities()
         
         if not opportunities:
-            console.print("[yellow]No new opportunities generated based on the current criteria.[/yellow]")
+            get_console().print("[yellow]No new opportunities generated based on the current criteria.[/yellow]")
             return
             
-        save_opportunities(opportunities)
-        console.print(f"[bold green]Successfully generated and saved {len(opportunities)} new opportunities.[/bold green]")
+        saved = save_opportunities(opportunities)
+        get_console().print(f"[bold green]Successfully generated and saved {saved} new opportunities.[/bold green]")
 
     except Exception as e:
-        console.print(f"[bold red]An error occurred during opportunity generation: {e}[/bold red]")
+        get_console().print(f"[bold red]An error occurred during opportunity generation: {e}[/bold red]")
 
 @opportunities_app.command()
-def show():
+def serve():
+    """
+    Runs a long-lived worker that generates opportunities on request.
+
+    The scorer and its spaCy model are loaded once, then every line read from
+    stdin is handled as a JSON job, e.g. `{"min_points": 5, "min_score": 0.5,
+    "similarity": 0.7, "save": true}` (all keys optional). Each job re-reads
+    the pain points from the database and answers with one line of JSON on
+    stdout: `{"opportunities": [...], "saved": n}` or `{"error": "..."}`.
+    Progress and log output go to stderr. The worker exits at end of input.
     """
-    Displays a table of all generated opportunities, sorted by score.
+    from ml.opportunity_scorer import OpportunityScorer
+
+    out = sys.stdout
+    # Keep stdout for responses; Rich progress bars and messages go to stderr
+    with contextlib.redirect_stdout(sys.stderr):
+        scorer = OpportunityScorer([])
+        get_console().print("[bold green]Opportunity worker ready; reading JSON jobs from stdin.[/bold green]")
+
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                job = json.loads(line)
+                scorer.pain_points = get_pain_points(columns=OpportunityScorer.PAIN_POINT_COLUMNS)
+                scorer.min_pain_points = job.get("min_points", 5)
+                scorer.min_score = job.get("min_score", 0.5)
+                scorer.similarity_threshold = job.get("similarity", 0.7)
+
+                opportunities = scorer.generate_opportunities() or []
+                saved = save_opportunities(opportunities) if job.get("save") and opportunities else 0
+                response = {"opportunities": opportunities, "saved": saved}
+            except Exception as e:
+                response = {"error": str(e)}
+            out.write(json.dumps(response) + "\n")
+            out.flush()
 
-    This command retrieves all opportunities from the database and presents them
-    in a formatted table, including their ID, Title, Category, and Total Score.
+@opportunities_app.command()
+def show(limit: int = typer.Option(50, "--limit", "-l", help="Maximum number of opportunities to display.")):
     """
-    opportunities = get_opportunities()
+    Displays a table of the top generated opportunities, sorted by score.
 
+    This command retrieves the highest-scoring opportunities from the database
+    and presents them in a formatted table, including their ID, Title, Category,
+    and Total Score.
+    """
     table = Table(title="Opportunities")
     table.add_column("ID", style="dim", width=6)
     table.add_column("Title", style="green")
     table.add_column("Category", style="cyan")
     table.add_column("Score", style="magenta", justify="right")
 
-    for opp in opportunities:
-        table.add_row(
-            str(opp.id),
-            opp.title,
-            opp.category,
-            f"{opp.total_score:.2f}"
-        )
+    # The cells come back from SQLite already formatted as strings
+    for opp_id, title, category, score, _ in get_opportunities_rows(limit, score_decimals=2):
+        table.add_row(opp_id, title, category, score)
 
-    console.print(table)
+    get_console().print(table)
 
 
 @opportunities_app.command()
@@ -88,7 +126,7 @@ def recommend():
             recommendation
         )
 
-    console.print(table)
+    get_console().print(table)
 
 
 if __name__ == "__main__":
@@ -7,18 +7,22 @@ app = typer.Typer(help="Commands for performance optimization.")
 console = Console()
 
 @app.command()
-def profile(command: str = typer.Argument(..., help="The full CLI command to profile, enclosed in quotes.")):
+def profile(
+    command: str = typer.Argument(..., help="The full CLI command to profile, enclosed in quotes."),
+    output: str = typer.Option("profile.prof", "--output", "-o", help="Where to save the raw profile data."),
+    top: int = typer.Option(30, "--top", help="Number of functions to list, by cumulative time.")
+):
     """
     Profiles a CLI command to identify performance bottlenecks.
     
     Example: reddit-finder optimize profile "scrape --subreddit SaaS --limit 100"
     """
-    profile_cli_command(command)
+    profile_cli_command(command, output_path=output, top=top)
 
 @app.command()
 def db_optimize():
     """
-    Optimizes the database by creating indexes on frequently queried columns.
+    Optimizes the database's indexes, journal mode and query planner statistics.
     """
     console.print("[bold cyan]Optimizing database...[/bold cyan]")
     optimize_database_queries()
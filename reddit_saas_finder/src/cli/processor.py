@@ -1,83 +1,220 @@
 """Handles all NLP processing tasks."""
+import collections
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
 import typer
 from rich.console import Console
-from nlp.pain_detector import BasicPainDetector, AdvancedPainDetector
+# nlp.pain_detector (spaCy, Transformers) is imported only where a detector is
+# loaded in this process, so runs served by a detector worker never import it.
+from nlp.detector_worker import connect_detector, serve_detector
 from nlp.categorizer import Categorizer
-from data.database import get_unprocessed_posts, get_unprocessed_comments, save_pain_points, PainPoint
+from nlp.pipeline import BATCH_SIZE, iter_sources, chunked, extract_batch
+from data.database import count_unprocessed, save_pain_points, get_db_connection
 from typing_extensions import Annotated
 
 console = Console()
 
+# Batches of pain points that may wait for the writer thread before the
+# detector blocks, bounding how far detection can run ahead of the database.
+WRITE_QUEUE_SIZE = 8
+# Batches waiting in the queue are combined into one transaction of up to
+# about this many pain points, so a backlog is written with fewer commits.
+WRITE_CHUNK_ROWS = 500
+
+# The detector and categorizer of a worker process, set up by `_init_worker`.
+_worker_state = {}
+
+def _init_worker(advanced: bool, workers: int):
+    """
+    Loads the detector and categorizer once in a new worker process.
+
+    Args:
+        advanced (bool): Whether to load the transformer-based detector.
+        workers (int): The number of worker processes sharing the CPU cores.
+    """
+    from nlp.pain_detector import get_pain_detector
+
+    _worker_state['detector'] = get_pain_detector(advanced)
+    _worker_state['categorizer'] = Categorizer()
+    _worker_state['seen'] = {}
+    if advanced:
+        try:
+            import torch
+            # Several model instances share the cores; give each its share
+            # rather than a thread per core (set after loading, which
+            # configures torch for the whole machine).
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // workers))
+        except ImportError:
+            pass
+
+def _extract_batch_in_worker(batch):
+    """Runs `extract_batch` with the worker process's own detector and categorizer."""
+    return extract_batch(_worker_state['detector'], _worker_state['categorizer'], batch, _worker_state['seen'])
+
+def _extract_in_processes(batches, advanced: bool, workers: int):
+    """
+    Runs `extract_batch` over `batches` in a pool of worker processes.
+
+    At most two batches per worker are in flight at a time, so sources are
+    read from the database only a little ahead of the detector. Workers are
+    started with "spawn" rather than forked, since by now this process runs
+    the writer thread and holds SQLite connections.
+
+    Args:
+        batches: An iterable of source batches, as yielded by `chunked`.
+        advanced (bool): Whether the workers use the transformer-based detector.
+        workers (int): The number of worker processes.
+
+    Yields:
+        tuple: The `extract_batch` result of each batch, in batch order.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(advanced, workers),
+    ) as executor:
+        pending = collections.deque()
+        for batch in batches:
+            pending.append(executor.submit(_extract_batch_in_worker, batch))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _write_batches(batches: queue.Queue, outcome: dict):
+    """
+    Saves batches of pain points taken from `batches` until it receives None,
+    marking the sources they came from as processed.
+
+    Runs on a writer thread so the database inserts overlap with detection
+    of the next batch. Every batch is written through the same connection,
+    and batches already waiting are saved together, up to WRITE_CHUNK_ROWS
+    pain points per transaction.
+
+    The number of pain points actually written is kept in `outcome['saved']`.
+    If writing fails, the exception is stored in `outcome['error']` and the
+    rest of the queue is drained unsaved, so the producer never blocks on a
+    full queue; `process` re-raises it once the writer has finished.
+
+    Args:
+        batches (queue.Queue): `extract_batch` results, followed by None.
+        outcome (dict): Receives the saved count under 'saved', and the
+            writer's error, if any, under 'error'.
+    """
+    done = False  # Whether the None sentinel has been taken from the queue
+    outcome['saved'] = 0
+    try:
+        conn = get_db_connection()
+        try:
+            while not done:
+                item = batches.get()
+                if item is None:
+                    done = True
+                    break
+                # Copied once, so waiting batches can be appended in place
+                pain_points, sources = list(item[0]), list(item[1])
+                while len(pain_points) < WRITE_CHUNK_ROWS:
+                    try:
+                        more = batches.get_nowait()
+                    except queue.Empty:
+                        break
+                    if more is None:
+                        done = True
+                        break
+                    pain_points.extend(more[0])
+                    sources.extend(more[1])
+                outcome['saved'] += save_pain_points(pain_points, conn, sources, raise_errors=True)
+        finally:
+            conn.close()
+    except Exception as e:
+        outcome['error'] = e
+        while not done:
+            done = batches.get() is None
+
 def process(
-    advanced: Annotated[bool, typer.Option("--advanced", help="Use advanced NLP model.")] = False
+    advanced: Annotated[bool, typer.Option("--advanced", help="Use advanced NLP model.")] = False,
+    workers: Annotated[int, typer.Option("--workers", "-w", min=1, help="Number of processes running the detector.")] = 1
 ):
     """
     Processes unprocessed data to find pain points.
+
+    With --workers above 1, batches are detected in that many processes,
+    each loading its own copy of the models. Otherwise a detector kept
+    loaded by `process-worker` is used when one is running.
     """
     console.print("[bold green]Starting NLP processing for pain points...[/bold green]")
     try:
         if advanced:
-            detector = AdvancedPainDetector()
             console.print("[bold blue]Using advanced pain point detector.[/bold blue]")
         else:
-            detector = BasicPainDetector()
             console.print("[bold blue]Using basic pain point detector.[/bold blue]")
 
-        categorizer = Categorizer()
-        posts = get_unprocessed_posts()
-        comments = get_unprocessed_comments()
-        
-        console.print(f"Processing {len(posts)} new posts and {len(comments)} new comments...")
-        
-        pain_points_to_save = []
-
-        for post in posts:
-            try:
-                full_text = (post.title or "") + " " + (post.content or "")
-                if not full_text.strip():
-                    continue
-                extracted = detector.extract_pain_points(full_text)
-                for pp in extracted:
-                    category = categorizer.classify_problem_category(pp['content'])
-                    pain_points_to_save.append(
-                        PainPoint(
-                            source_id=post.id,
-                            source_type='post',
-                            content=pp['content'],
-                            category=category,
-                            severity_score=pp.get('confidence', 0.5),
-                            confidence_score=pp.get('confidence', 0.5)
-                        )
-                    )
-            except Exception as e:
-                console.print(f"[bold red]Failed to process post {post.id}: {e}[/bold red]")
-
-        for comment in comments:
-            try:
-                if not comment.content or not comment.content.strip():
-                    continue
-                extracted = detector.extract_pain_points(comment.content)
-                for pp in extracted:
-                    category = categorizer.classify_problem_category(pp['content'])
-                    pain_points_to_save.append(
-                        PainPoint(
-                            source_id=comment.id,
-                            source_type='comment',
-                            content=pp['content'],
-                            category=category,
-                            severity_score=pp.get('confidence', 0.5),
-                            confidence_score=pp.get('confidence', 0.5)
-                        )
-                    )
-            except Exception as e:
-                console.print(f"[bold red]Failed to process comment {comment.id}: {e}[/bold red]")
-
-        if pain_points_to_save:
-            save_pain_points(pain_points_to_save)
-            console.print(f"[bold green]Successfully detected and saved {len(pain_points_to_save)} new pain points.[/bold green]")
+        post_count, comment_count = count_unprocessed()
+
+        console.print(f"Processing {post_count} new posts and {comment_count} new comments...")
+
+        batches = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+        outcome = {}
+        writer = threading.Thread(target=_write_batches, args=(batches, outcome), name="pain-point-writer")
+        writer.start()
+        sources_iter = iter_sources()
+        try:
+            source_batches = chunked(sources_iter, BATCH_SIZE)
+            if workers > 1:
+                console.print(f"Running the detector in {workers} processes...")
+                results = _extract_in_processes(source_batches, advanced, workers)
+            else:
+                detector = connect_detector(advanced)
+                if detector is not None:
+                    console.print("Using the running detector worker.")
+                else:
+                    from nlp.pain_detector import get_pain_detector
+                    detector = get_pain_detector(advanced)
+                categorizer = Categorizer()
+                seen = {}
+                results = (extract_batch(detector, categorizer, batch, seen) for batch in source_batches)
+            for pain_points, sources in results:
+                if 'error' in outcome:
+                    break  # Nothing more can be saved; stop detecting
+                if sources:
+                    batches.put((pain_points, sources))
+        finally:
+            # Release the read cursor now, on this thread, even if stopped early
+            sources_iter.close()
+            # Let the writer drain what is queued, then wait for it to finish
+            batches.put(None)
+            writer.join()
+        if 'error' in outcome:
+            raise outcome['error']
+
+        # Counted by the writer, so batches whose transaction failed are left out
+        saved_count = outcome['saved']
+        if saved_count:
+            console.print(f"[bold green]Successfully detected and saved {saved_count} new pain points.[/bold green]")
         else:
             console.print("[bold yellow]No new pain points detected.[/bold yellow]")
             
         console.print("[bold green]Pain point processing completed successfully.[/bold green]")
     except Exception as e:
-        console.print(f"[bold red]An error occurred during NLP processing: {e}[/bold red]") 
\ No newline at end of file
+        console.print(f"[bold red]An error occurred during NLP processing: {e}[/bold red]") 
+
+def serve(
+    advanced: Annotated[bool, typer.Option("--advanced/--basic", help="Serve the advanced or basic (default) detector.")] = False
+):
+    """
+    Keeps the pain point detector loaded for later `process` runs.
+
+    The models are loaded once; `process` runs with the same detector type
+    then send their batches to this worker instead of loading the models
+    themselves. Like `process`, it uses the basic detector unless given
+    --advanced. Stop the worker with Ctrl+C.
+    """
+    try:
+        serve_detector(advanced)
+    except KeyboardInterrupt:
+        console.print("Detector worker stopped.")
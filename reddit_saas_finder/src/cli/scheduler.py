@@ -3,7 +3,6 @@ import typer
 from rich.console import Console
 
 from utils.scheduler import TaskScheduler
-from utils.config import ConfigManager
 
 app = typer.Typer(help="Commands for scheduling scraping and processing tasks.")
 console = Console()
@@ -19,7 +18,9 @@ def start(
     and processing pipeline. The interval can be set via the `--interval` option
     or configured in the `default.yaml` file.
     """
-    config_manager = ConfigManager()
+    from utils.config import get_config_manager
+
+    config_manager = get_config_manager()
     config = config_manager.config
     scheduler_config = config.get('scheduler', {})
     
@@ -1,59 +1,97 @@
 """Handles all Reddit data collection."""
+import queue
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import typer
-import yaml
-from rich import print
-from data.reddit_client import RedditClient
+from utils.formatters import echo
+from typing import Optional
 from typing_extensions import Annotated
-from utils.config import ConfigManager
+from utils.config import get_config_manager
 
 
 app = typer.Typer()
 
 @app.command()
 def single(
-    subreddit: Annotated[str, typer.Option("--subreddit", "-s", help="The subreddit to scrape.")] = "entrepreneur",
-    limit: Annotated[int, typer.Option("--limit", "-l", help="The maximum number of posts to scrape.")] = 100,
-    time_filter: Annotated[str, typer.Option("--time", "-t", help="Time filter: 'day', 'week', 'month', 'year', 'all'.")] = "week"
+    subreddit: Annotated[str, typer.Option("--subreddit", "-s", help="The subreddit to scrape, or a comma-separated list of subreddits.")] = "entrepreneur",
+    limit: Annotated[int, typer.Option("--limit", "-l", help="The maximum number of posts to scrape (across all the subreddits given).")] = 100,
+    time_filter: Annotated[str, typer.Option("--time", "-t", help="Time filter: 'day', 'week', 'month', 'year', 'all'.")] = "week",
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="Scrape again even if the same scrape ran within the last hour.")] = False
 ):
     """
     Scrapes posts and their comments from a specific subreddit.
+
+    Several subreddits can be given as a comma-separated list; they are
+    fetched as one combined listing (r/A+B+C), which takes a single API
+    request per page instead of one per subreddit.
     """
+    # Reddit serves the combined listing of "A+B+C" as if it were one subreddit
+    subreddit = "+".join(name.strip() for name in subreddit.split(",") if name.strip())
+    from data.reddit_client import RedditClient  # Imports PRAW
+
     try:
         client = RedditClient()
-        client.scrape_subreddit(subreddit_name=subreddit, limit=limit, time_filter=time_filter)
-        print(f"[bold green]Scraping task for r/{subreddit} completed.[/bold green]")
+        client.scrape_subreddit(subreddit_name=subreddit, limit=limit, time_filter=time_filter, use_cache=not no_cache)
+        echo(f"[bold green]Scraping task for r/{subreddit} completed.[/bold green]")
     except Exception as e:
-        print(f"[bold red]An error occurred during scraping setup: {e}[/bold red]")
+        echo(f"[bold red]An error occurred during scraping setup: {e}[/bold red]")
 
 @app.command()
 def batch(
-    config_file: Annotated[str, typer.Option("--config", "-c", help="Path to the subreddits YAML config file.")] = "src/config/subreddits.yaml",
+    config_file: Annotated[Optional[str], typer.Option("--config", "-c", help="Path to a subreddits YAML config file. Defaults to the packaged subreddits.yaml.")] = None,
     limit: Annotated[int, typer.Option("--limit", "-l", help="The maximum number of posts to scrape per subreddit.")] = 100,
-    time_filter: Annotated[str, typer.Option("--time", "-t", help="Time filter: 'day', 'week', 'month', 'year', 'all'.")] = "week"
+    time_filter: Annotated[str, typer.Option("--time", "-t", help="Time filter: 'day', 'week', 'month', 'year', 'all'.")] = "week",
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="Scrape again even if the same scrape ran within the last hour.")] = False
 ):
     """
     Scrapes posts and comments from a batch of subreddits defined in a YAML file.
     """
+    from data.reddit_client import RedditClient  # Imports PRAW
+
     try:
-        config_manager = ConfigManager()
-        primary, secondary = config_manager.load_subreddits()
+        config_manager = get_config_manager()
+        primary, secondary = config_manager.load_subreddits(config_file)
         all_subreddits = primary + secondary
 
         if not all_subreddits:
-            print("[bold red]No subreddits found in the config file.[/bold red]")
+            echo("[bold red]No subreddits found in the config file.[/bold red]")
             return
 
-        client = RedditClient()
-        print(f"Starting batch scrape for {len(all_subreddits)} subreddits...")
+        # One client per configured OAuth app, each with its own rate limit
+        credential_sets = config_manager.get_reddit_credential_sets()
+        clients = [RedditClient(credentials) for credentials in credential_sets] or [RedditClient()]
+
+        pending = queue.SimpleQueue()
         for subreddit_name in all_subreddits:
-            print(f"Scraping r/{subreddit_name}...")
-            client.scrape_subreddit(subreddit_name=subreddit_name, limit=limit, time_filter=time_filter)
-        print("[bold green]Batch scraping completed.[/bold green]")
+            pending.put(subreddit_name)
+
+        def scrape_all(client):
+            while True:
+                try:
+                    subreddit_name = pending.get_nowait()
+                except queue.Empty:
+                    return
+                echo(f"Scraping r/{subreddit_name}...")
+                client.scrape_subreddit(subreddit_name=subreddit_name, limit=limit, time_filter=time_filter, use_cache=not no_cache)
+
+        echo(f"Starting batch scrape for {len(all_subreddits)} subreddits with {len(clients)} client(s)...")
+        if len(clients) == 1:
+            scrape_all(clients[0])
+        else:
+            # PRAW instances aren't thread-safe and each one already paces its
+            # requests to its token's rate limit, so every client gets exactly
+            # one worker thread. The workers take subreddits from a shared
+            # queue, so a client that finishes early picks up the remaining work.
+            with ThreadPoolExecutor(max_workers=len(clients)) as executor:
+                futures = [executor.submit(scrape_all, client) for client in clients]
+                for future in as_completed(futures):
+                    future.result()
+        echo("[bold green]Batch scraping completed.[/bold green]")
 
     except FileNotFoundError:
-        print(f"[bold red]Error: Config file not found at {config_file}[/bold red]")
+        echo(f"[bold red]Error: Config file not found at {config_file}[/bold red]")
     except Exception as e:
-        print(f"[bold red]An error occurred during batch scraping: {e}[/bold red]")
+        echo(f"[bold red]An error occurred during batch scraping: {e}[/bold red]")
 
 if __name__ == "__main__":
     app()
@@ -4,13 +4,25 @@ from rich.console import Console
 
 from utils.validators import DataValidator
 from data.database import get_db_connection
-from utils.config import ConfigManager
+from utils.config import get_config_manager
 
 app = typer.Typer(help="Commands for data validation and quality checks.")
 console = Console()
 
+def _run_validation(validator: DataValidator):
+    """Runs the validation checks with the configured thresholds and stores the results."""
+    config = get_config_manager().config
+    validator.validate_data(
+        spam_threshold=config.get('validation', {}).get('spam_score_threshold', 1),
+        min_post_length=config.get('validation', {}).get('min_post_length', 20),
+        min_comment_length=config.get('validation', {}).get('min_comment_length', 10)
+    )
+    validator.save_report()
+
 @app.command()
-def data():
+def data(
+    report: bool = typer.Option(False, "--report/--no-report", help="Also display the quality report.")
+):
     """
     Performs a comprehensive validation of the data in the database.
 
@@ -18,42 +30,41 @@ def data():
     - Spam content based on a score threshold.
     - Minimum length for posts and comments.
     - Other quality metrics defined in the configuration.
+
+    The results are stored for `validate report`.
     """
     console.print("[bold cyan]Running data validation...[/bold cyan]")
-    config_manager = ConfigManager()
-    config = config_manager.config
     conn = get_db_connection()
-    validator = DataValidator(conn)
-    
-    validator.validate_data(
-        spam_threshold=config.get('validation', {}).get('spam_score_threshold', 1),
-        min_post_length=config.get('validation', {}).get('min_post_length', 20),
-        min_comment_length=config.get('validation', {}).get('min_comment_length', 10)
-    )
-    
-    conn.close()
-    console.print("[bold green]Data validation complete. Use 'validate report' to see the results.[/bold green]")
+    try:
+        validator = DataValidator(conn)
+        _run_validation(validator)
+        if report:
+            validator.generate_quality_report()
+    finally:
+        conn.close()
+    if not report:
+        console.print("[bold green]Data validation complete. Use 'validate report' to see the results.[/bold green]")
 
 @app.command()
-def report():
+def report(
+    refresh: bool = typer.Option(False, "--refresh", help="Run the validation again instead of showing the last stored results.")
+):
     """
     Generates and displays a detailed data quality report.
 
-    This command first runs the data validation process and then
-    presents a summary report of the findings, including any
-    identified issues with data quality.
+    This command presents the results of the most recent validation run,
+    including any identified issues with data quality. The validation is
+    run first if it has never been run, or if --refresh is given.
     """
     console.print("[bold cyan]Generating data quality report...[/bold cyan]")
     conn = get_db_connection()
-    validator = DataValidator(conn)
-    # The validator needs to be run first to have a report.
-    # This CLI structure is a bit problematic. Let's run validation and then report.
-    config_manager = ConfigManager()
-    config = config_manager.config
-    validator.validate_data(
-        spam_threshold=config.get('validation', {}).get('spam_score_threshold', 1),
-        min_post_length=config.get('validation', {}).get('min_post_length', 20),
-        min_comment_length=config.get('validation', {}).get('min_comment_length', 10)
-    )
-    validator.generate_quality_report()
-    conn.close() 
\ No newline at end of file
+    try:
+        validator = DataValidator(conn)
+        ran_at = None if refresh else validator.load_latest_report()
+        if ran_at is None:
+            _run_validation(validator)
+        else:
+            console.print(f"Showing the validation run from {ran_at} UTC (use --refresh to re-run it).")
+        validator.generate_quality_report()
+    finally:
+        conn.close()
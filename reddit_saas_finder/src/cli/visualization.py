@@ -1,14 +1,17 @@
 """Handles terminal-based data visualization."""
 import typer
-from rich import print
 from rich.console import Console
 from rich.table import Table
 
-from data.database import get_opportunities, get_category_distribution
+from data.database import get_opportunities_rows, get_category_distribution
 
 app = typer.Typer()
 console = Console()
 
+# Tables with more rows than this are drawn without borders and with titles
+# cut to one line, which keeps Rich's per-row layout work down.
+PRETTY_TABLE_MAX_ROWS = 500
+
 class TerminalVisualizer:
     """
     A class to handle the display of data in formatted terminal tables and charts.
@@ -22,28 +25,27 @@ class TerminalVisualizer:
         Fetches and displays the top N opportunities in a formatted table.
 
         Args:
-            limit (int): The maximum number of opportunities to display.
+            limit (int): The maximum number of opportunities to display. Above
+                PRETTY_TABLE_MAX_ROWS rows, a compact table is shown.
         """
-        opportunities = get_opportunities(limit)
-        if not opportunities:
+        rows = get_opportunities_rows(limit)
+        if not rows:
             console.print("[bold yellow]No opportunities found to display.[/bold yellow]")
             return
 
+        compact = len(rows) > PRETTY_TABLE_MAX_ROWS
         table = Table(title=f"Top {limit} SaaS Opportunities", show_header=True, header_style="bold magenta")
+        if compact:
+            table.box = None
+            table.show_edge = False
         table.add_column("ID", style="dim", width=6)
-        table.add_column("Title", style="bold", min_width=40)
+        table.add_column("Title", style="bold", min_width=40, no_wrap=compact)
         table.add_column("Category", style="cyan", width=20)
         table.add_column("Score", style="green", justify="right")
         table.add_column("Pain Points", style="yellow", justify="right")
         
-        for opp in opportunities:
-            table.add_row(
-                str(opp.id),
-                opp.title,
-                opp.category,
-                f"{opp.total_score:.3f}",
-                str(opp.pain_point_count)
-            )
+        for row in rows:
+            table.add_row(*row)
         
         console.print(table)
 
@@ -59,15 +61,18 @@ class TerminalVisualizer:
             console.print("[bold yellow]No category data to display.[/bold yellow]")
             return
 
-        console.print("\n[bold]Opportunity Distribution by Category:[/bold]")
         table = Table(show_header=True, header_style="bold blue")
         table.add_column("Category", style="cyan")
         table.add_column("Count", style="green", justify="right")
 
         for category, count in distribution:
             table.add_row(category, str(count))
-            
-        console.print(table)
+
+        # Rich writes each print in one write() call; inside `with console`
+        # the heading and table are buffered and written together.
+        with console:
+            console.print("\n[bold]Opportunity Distribution by Category:[/bold]")
+            console.print(table)
 
 @app.command("table")
 def show_table(
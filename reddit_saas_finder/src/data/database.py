@@ -1,7 +1,12 @@
 import sqlite3
 import os
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
-from typing import List, Dict, Any, Tuple, Optional
+from operator import attrgetter
+from typing import List, Dict, Any, Iterable, Tuple, Optional
 from rich.console import Console
 import typer
 
@@ -17,8 +22,36 @@ DB_DIR = os.path.join(PROJECT_ROOT, "data")
 DB_PATH = os.path.join(DB_DIR, "reddit_data.db")
 
 # --- Data Models ---
-class Post:
+def _to_datetime(created_utc) -> datetime:
+    """Converts a stored creation time (ISO text or a Unix timestamp) to a datetime."""
+    return datetime.fromisoformat(created_utc) if isinstance(created_utc, str) else datetime.fromtimestamp(created_utc)
+
+class _LazyCreatedUtc:
+    """Mixin exposing `created_utc` as a datetime built from `_created_utc_raw` on first access.
+
+    Bulk readers such as the NLP pipeline never look at the timestamp, so they
+    don't pay for a datetime per row.
+    """
+    __slots__ = ('_created_utc_raw', '_created_utc')
+
+    @property
+    def created_utc(self) -> datetime:
+        try:
+            return self._created_utc
+        except AttributeError:
+            self._created_utc = _to_datetime(self._created_utc_raw)
+            return self._created_utc
+
+class Post(_LazyCreatedUtc):
     """Represents a Reddit post."""
+    # The order of the columns `_iter_unprocessed` reads, so rows can be
+    # passed positionally.
+    COLUMNS = (
+        'id', 'subreddit', 'title', 'content', 'author', 'score', 'num_comments',
+        'created_utc', 'url', 'flair', 'is_self', 'upvote_ratio', 'processed',
+    )
+    __slots__ = tuple(column for column in COLUMNS if column != 'created_utc')
+
     def __init__(self, id: str, subreddit: str, title: str, content: Optional[str], author: Optional[str], score: int, num_comments: int, created_utc: float, url: str, flair: Optional[str], is_self: bool, upvote_ratio: float, processed: bool = False, **kwargs):
         """Initializes a Post object.
 
@@ -30,7 +63,8 @@ class Post:
             author (Optional[str]): The author of the post.
             score (int): The score of the post.
             num_comments (int): The number of comments on the post.
-            created_utc (float): The UTC timestamp of when the post was created.
+            created_utc (float): The UTC timestamp of when the post was created,
+                or its stored ISO text.
             url (str): The URL of the post.
             flair (Optional[str]): The flair of the post.
             is_self (bool): Whether the post is a self-post.
@@ -44,15 +78,22 @@ class Post:
         self.author = author
         self.score = score
         self.num_comments = num_comments
-        self.created_utc = datetime.fromisoformat(created_utc) if isinstance(created_utc, str) else datetime.fromtimestamp(created_utc)
+        self._created_utc_raw = created_utc  # Converted by the `created_utc` property when read
         self.url = url
         self.flair = flair
         self.is_self = is_self
         self.upvote_ratio = upvote_ratio
         self.processed = bool(processed)
 
-class Comment:
+class Comment(_LazyCreatedUtc):
     """Represents a Reddit comment."""
+    # The order of the columns `_iter_unprocessed` reads.
+    COLUMNS = (
+        'id', 'post_id', 'content', 'author', 'score', 'created_utc', 'parent_id',
+        'depth', 'is_submitter', 'processed',
+    )
+    __slots__ = tuple(column for column in COLUMNS if column != 'created_utc')
+
     def __init__(self, id: str, post_id: str, content: str, author: Optional[str], score: int, created_utc: float, parent_id: str, depth: int, is_submitter: bool, processed: bool = False, **kwargs):
         """Initializes a Comment object.
 
@@ -62,7 +103,8 @@ class Comment:
             content (str): The text content of the comment.
             author (Optional[str]): The author of the comment.
             score (int): The score of the comment.
-            created_utc (float): The UTC timestamp of when the comment was created.
+            created_utc (float): The UTC timestamp of when the comment was created,
+                or its stored ISO text.
             parent_id (str): The ID of the parent comment or post.
             depth (int): The depth of the comment in the thread.
             is_submitter (bool): Whether the comment author is the post submitter.
@@ -73,7 +115,7 @@ class Comment:
         self.content = content
         self.author = author
         self.score = score
-        self.created_utc = datetime.fromisoformat(created_utc) if isinstance(created_utc, str) else datetime.fromtimestamp(created_utc)
+        self._created_utc_raw = created_utc  # Converted by the `created_utc` property when read
         self.parent_id = parent_id
         self.depth = depth
         self.is_submitter = is_submitter
@@ -81,6 +123,19 @@ class Comment:
 
 class PainPoint:
     """Represents a pain point extracted from a post or comment."""
+    __slots__ = (
+        'source_id', 'source_type', 'content', 'category', 'severity_score', 'confidence_score',
+        'sentiment_score', 'keywords', 'processed_at', 'subreddit', 'engagement_score',
+    )
+    # Reads every slot in one C-level call, in `__slots__` order.
+    _field_values = attrgetter(*__slots__)
+    # The columns `save_pain_points` writes, and a getter for their values in order.
+    INSERT_COLUMNS = (
+        'source_id', 'source_type', 'content', 'category', 'severity_score',
+        'confidence_score', 'sentiment_score', 'keywords', 'subreddit', 'engagement_score',
+    )
+    _insert_values = attrgetter(*INSERT_COLUMNS)
+
     def __init__(self, source_id: str, source_type: str, content: str, category: Optional[str] = None, **kwargs):
         """Initializes a PainPoint object.
 
@@ -98,12 +153,30 @@ class PainPoint:
         self.confidence_score: Optional[float] = kwargs.get('confidence_score')
         self.sentiment_score: Optional[float] = kwargs.get('sentiment_score')
         self.keywords: Optional[str] = kwargs.get('keywords') # Stored as JSON string
-        self.processed_at: datetime = datetime.utcnow()
+        # Left to the column's DEFAULT CURRENT_TIMESTAMP when the row is inserted
+        self.processed_at: Optional[datetime] = kwargs.get('processed_at')
         self.subreddit: Optional[str] = kwargs.get('subreddit')
         self.engagement_score: Optional[float] = kwargs.get('engagement_score')
 
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the pain point's fields as a dictionary."""
+        return dict(zip(self.__slots__, self._field_values(self)))
+
+# A lightweight pain point for the detection pipeline to hand to
+# `save_pain_points`: a plain tuple of the inserted columns, in order. Only
+# the source and content are required; the other fields default to None.
+PainPointRow = namedtuple(
+    "PainPointRow", PainPoint.INSERT_COLUMNS, defaults=(None,) * (len(PainPoint.INSERT_COLUMNS) - 3)
+)
+
 class Opportunity:
     """Represents a potential SaaS opportunity."""
+    __slots__ = (
+        'id', 'title', 'description', 'category', 'total_score', 'pain_point_count',
+        'market_score', 'pain_point_ids',
+    )
+    _field_values = attrgetter(*__slots__)
+
     def __init__(self, id: int, title: str, description: str, category: str, total_score: float, pain_point_count: int, **kwargs):
         """Initializes an Opportunity object.
 
@@ -124,8 +197,16 @@ class Opportunity:
         self.market_score: float = kwargs.get('market_score', 0.0)
         self.pain_point_ids: str = kwargs.get('pain_point_ids', '[]')
 
+    def as_dict(self) -> Dict[str, Any]:
+        """Returns the opportunity's fields as a dictionary."""
+        return dict(zip(self.__slots__, self._field_values(self)))
+
 
 # --- Schema Definitions ---
+
+# Stored in the database's `PRAGMA user_version` once the schema below has
+# been applied. Bump it whenever a table, view or index is added or changed.
+SCHEMA_VERSION = 5
 POSTS_SCHEMA = """
 CREATE TABLE IF NOT EXISTS posts (
     id TEXT PRIMARY KEY,
@@ -194,21 +275,87 @@ CREATE TABLE IF NOT EXISTS opportunities (
 );
 """
 
-def create_indexes(connection):
-    """Creates indexes on frequently queried columns to improve performance."""
-    cursor = connection.cursor()
-    console.print("Creating database indexes for performance...")
+# Results of each `validate` run, so `validate report` can show the latest
+# one without re-scanning the posts and comments.
+VALIDATION_RUNS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS validation_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ran_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    report TEXT NOT NULL -- The DataValidator report, as a JSON object
+);
+"""
+
+# Creation time of every pain point source, so pain points can be dated with a
+# single join on (source_type, source_id) instead of one join per source table.
+SOURCE_CREATED_VIEW = """
+CREATE VIEW IF NOT EXISTS source_created AS
+SELECT id, created_utc, 'post' AS source_type FROM posts
+UNION ALL
+SELECT id, created_utc, 'comment' AS source_type FROM comments;
+"""
+
+INDEXES_SQL = """
+-- Partial indexes over just the unprocessed rows, which stay small as rows
+-- are processed; they replace the earlier full indexes on `processed`.
+DROP INDEX IF EXISTS idx_posts_processed;
+DROP INDEX IF EXISTS idx_comments_processed;
+CREATE INDEX IF NOT EXISTS idx_posts_unprocessed ON posts(processed) WHERE processed = 0;
+CREATE INDEX IF NOT EXISTS idx_comments_unprocessed ON comments(processed) WHERE processed = 0;
+CREATE INDEX IF NOT EXISTS idx_comments_post_id ON comments(post_id);
+-- Per-subreddit listings and date-range filters on posts
+CREATE INDEX IF NOT EXISTS idx_posts_subreddit_created ON posts(subreddit, created_utc);
+-- Used by the pain point -> post/comment joins in the trend queries
+CREATE INDEX IF NOT EXISTS idx_pain_points_source ON pain_points(source_type, source_id);
+-- Serves the ORDER BY total_score DESC LIMIT n listings without a sort
+CREATE INDEX IF NOT EXISTS idx_opportunities_total_score ON opportunities(total_score DESC);
+-- Lets the category distribution's GROUP BY read the index instead of the table
+CREATE INDEX IF NOT EXISTS idx_opportunities_category ON opportunities(category);
+"""
+
+# Every table, view and index, applied by `initialize_database` as one script.
+SCHEMA_SQL = "".join([
+    POSTS_SCHEMA,
+    COMMENTS_SCHEMA,
+    PAIN_POINTS_SCHEMA,
+    OPPORTUNITIES_SCHEMA,
+    VALIDATION_RUNS_SCHEMA,
+    SOURCE_CREATED_VIEW,
+    INDEXES_SQL,
+])
+
+def create_indexes(connection, quiet: bool = False) -> bool:
+    """Creates indexes on frequently queried columns to improve performance.
+
+    Args:
+        connection (sqlite3.Connection): An open database connection.
+        quiet (bool, optional): Whether to suppress progress messages; errors
+            are still reported. Defaults to False.
+
+    Returns:
+        bool: True if the indexes were created, False if an error occurred.
+    """
+    if not quiet:
+        console.print("Creating database indexes for performance...")
     try:
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_posts_processed ON posts(processed);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_comments_processed ON comments(processed);")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_comments_post_id ON comments(post_id);")
-        connection.commit()
-        console.print("[bold green]Database indexes created successfully.[/bold green]")
+        connection.executescript(f"BEGIN;{INDEXES_SQL}COMMIT;")
+        if not quiet:
+            console.print("[bold green]Database indexes created successfully.[/bold green]")
+        return True
     except Exception as e:
         console.print(f"[bold red]Error creating indexes: {e}[/bold red]")
-        connection.rollback()
-    finally:
-        cursor.close()
+        if connection.in_transaction:
+            connection.rollback()
+        return False
+
+# Applied to every new file database connection by `get_db_connection`.
+CONNECTION_PRAGMAS = """
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+"""
+# Databases whose journal mode this process has already set to WAL.
+_wal_databases = set()
 
 def get_db_connection(db_path: str = DB_PATH):
     """Establishes a connection to the SQLite database.
@@ -217,6 +364,11 @@ def get_db_connection(db_path: str = DB_PATH):
         db_path (str, optional): The path to the database file. 
             Defaults to DB_PATH.
 
+    File databases use write-ahead logging with `synchronous=NORMAL`, so
+    commits don't wait on a full fsync and readers don't block the writer.
+    Every connection also gets a 64 MiB page cache, in-memory temp tables
+    and memory-mapped reads.
+
     Returns:
         sqlite3.Connection: A connection object to the database.
     """
@@ -224,10 +376,76 @@ def get_db_connection(db_path: str = DB_PATH):
         os.makedirs(os.path.dirname(db_path), exist_ok=True)
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
+    if db_path != ":memory:":
+        # The journal mode is stored in the database file, so it only needs
+        # setting once per process; the other pragmas are per connection.
+        if db_path not in _wal_databases:
+            conn.execute("PRAGMA journal_mode=WAL")
+            _wal_databases.add(db_path)
+        conn.executescript(CONNECTION_PRAGMAS)
     return conn
 
-def initialize_database(connection=None):
-    """Initializes the database by creating tables if they don't exist."""
+# The connection the data access functions below share for the rest of a CLI
+# command, set by `use_shared_connection`. New threads start without one.
+_shared_connection: ContextVar[Optional[sqlite3.Connection]] = ContextVar("shared_connection", default=None)
+
+@contextmanager
+def use_shared_connection(db_path: str = DB_PATH):
+    """Opens one connection for the data access functions to reuse until the block exits.
+
+    Args:
+        db_path (str, optional): The path to the database file.
+            Defaults to DB_PATH.
+
+    Yields:
+        sqlite3.Connection: The shared connection, closed on exit.
+    """
+    conn = get_db_connection(db_path)
+    token = _shared_connection.set(conn)
+    try:
+        yield conn
+    finally:
+        _shared_connection.reset(token)
+        conn.close()
+
+@contextmanager
+def _connection(connection=None):
+    """Yields `connection`, else the shared connection, else a new one that is closed afterwards.
+
+    Like `with conn:`, the work done in the block is committed on success and
+    rolled back on error.
+    """
+    conn = connection or _shared_connection.get()
+    owned = conn is None
+    if owned:
+        conn = get_db_connection()
+    try:
+        with conn:
+            yield conn
+    finally:
+        if owned:
+            conn.close()
+
+def schema_is_current(connection) -> bool:
+    """Checks whether `initialize_database` has already applied the current schema.
+
+    Args:
+        connection (sqlite3.Connection): An open database connection.
+
+    Returns:
+        bool: True if the database's `user_version` is at least SCHEMA_VERSION.
+    """
+    return connection.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION
+
+def initialize_database(connection=None, quiet: bool = False):
+    """Initializes the database by creating its tables, view and indexes if they don't exist.
+
+    Args:
+        connection (sqlite3.Connection, optional): The connection to use. Defaults
+            to None, which opens (and closes) a new one.
+        quiet (bool, optional): Whether to suppress progress messages; errors
+            are still reported. Defaults to False.
+    """
     close_conn = False
     if connection is None:
         connection = get_db_connection()
@@ -237,19 +455,18 @@ def initialize_database(connection=None):
         return  # Stop if connection failed
 
     try:
-        cursor = connection.cursor()
-        cursor.execute(POSTS_SCHEMA)
-        cursor.execute(COMMENTS_SCHEMA)
-        cursor.execute(PAIN_POINTS_SCHEMA)
-        cursor.execute(OPPORTUNITIES_SCHEMA)
-        connection.commit()
-        console.print("[bold green]Database tables are set up.[/bold green]")
-        
-        # Create indexes for performance
-        create_indexes(connection)
+        # One script and one transaction: the tables, view, indexes and schema
+        # version are committed together, or not at all.
+        connection.executescript(
+            f"BEGIN;{SCHEMA_SQL}PRAGMA user_version = {SCHEMA_VERSION};\nCOMMIT;"
+        )
+        if not quiet:
+            console.print("[bold green]Database tables and indexes are set up.[/bold green]")
 
     except sqlite3.Error as e:
         console.print(f"[bold red]Database error: {e}[/bold red]")
+        if connection.in_transaction:
+            connection.rollback()
     finally:
         if close_conn and connection:
             connection.close()
@@ -257,29 +474,41 @@ def initialize_database(connection=None):
 
 # --- Data Access Functions ---
 
-def save_posts_and_comments(posts: List[Dict[str, Any]], comments: List[Dict[str, Any]]):
+def save_posts_and_comments(posts: List[Dict[str, Any]], comments: List[Dict[str, Any]]) -> int:
     """Saves posts and their corresponding comments to the database in a single transaction.
 
     This function performs a bulk `INSERT OR IGNORE` operation, so existing records
-    are not updated.
+    are not updated. Both inserts are committed together, or rolled back together
+    if either fails; unless the connection is already in a transaction, the
+    write lock is taken up front so a concurrent writer fails fast instead of
+    midway through. Timestamps are converted from Unix time by SQLite, to the
+    same local-time text `datetime` values were stored as.
 
     Args:
         posts (List[Dict[str, Any]]): A list of dictionaries, each representing a post.
         comments (List[Dict[str, Any]]): A list of dictionaries, each representing a comment.
+
+    Returns:
+        int: The number of new posts and comments saved.
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Insert posts
-        post_data = [(p['id'], p['subreddit'], p['title'], p.get('selftext', ''), p['author'], p['score'], p['num_comments'], datetime.fromtimestamp(p['created_utc']), p['url'], p.get('link_flair_text'), p['is_self'], p['upvote_ratio']) for p in posts]
-        cursor.executemany("INSERT OR IGNORE INTO posts (id, subreddit, title, content, author, score, num_comments, created_utc, url, flair, is_self, upvote_ratio) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", post_data)
-        
-        # Insert comments
-        comment_data = [(c['id'], c['post_id'], c['body'], c.get('author'), c['score'], datetime.fromtimestamp(c['created_utc']), c['parent_id'], c['depth'], c['is_submitter']) for c in comments]
-        cursor.executemany("INSERT OR IGNORE INTO comments (id, post_id, content, author, score, created_utc, parent_id, depth, is_submitter) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", comment_data)
-        
-        conn.commit()
-        console.print(f"Saved {cursor.rowcount} new items to the database.")
+    post_data = ((p['id'], p['subreddit'], p['title'], p.get('selftext', ''), p['author'], p['score'], p['num_comments'], p['created_utc'], p['url'], p.get('link_flair_text'), p['is_self'], p['upvote_ratio']) for p in posts)
+    comment_data = ((c['id'], c['post_id'], c['body'], c.get('author'), c['score'], c['created_utc'], c['parent_id'], c['depth'], c['is_submitter']) for c in comments)
+
+    with _connection() as conn:
+        before = conn.total_changes
+        # A shared connection may already be inside a transaction; join it then
+        began = not conn.in_transaction
+        if began:
+            conn.execute("BEGIN IMMEDIATE")
+        conn.executemany("INSERT OR IGNORE INTO posts (id, subreddit, title, content, author, score, num_comments, created_utc, url, flair, is_self, upvote_ratio) VALUES (?, ?, ?, ?, ?, ?, ?, datetime(?, 'unixepoch', 'localtime'), ?, ?, ?, ?)", post_data)
+        conn.executemany("INSERT OR IGNORE INTO comments (id, post_id, content, author, score, created_utc, parent_id, depth, is_submitter) VALUES (?, ?, ?, ?, ?, datetime(?, 'unixepoch', 'localtime'), ?, ?, ?)", comment_data)
+        # Counts the rows actually inserted by both statements; ignored duplicates don't count
+        saved = conn.total_changes - before
+        if began:
+            conn.execute("COMMIT")
+
+    console.print(f"Saved {saved} new items to the database.")
+    return saved
 
 def get_unprocessed_posts() -> List[Post]:
     """Fetches all posts from the database that have not yet been processed.
@@ -287,10 +516,9 @@ def get_unprocessed_posts() -> List[Post]:
     Returns:
         List[Post]: A list of Post objects.
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM posts WHERE processed = 0")
-        return [Post(**row) for row in cursor.fetchall()]
+    with _connection() as conn:
+        cursor = conn.execute(f"SELECT {', '.join(Post.COLUMNS)} FROM posts WHERE processed = 0")
+        return [Post(*row) for row in cursor]
 
 def get_unprocessed_comments() -> List[Comment]:
     """Fetches all comments from the database that have not yet been processed.
@@ -298,78 +526,232 @@ def get_unprocessed_comments() -> List[Comment]:
     Returns:
         List[Comment]: A list of Comment objects.
     """
-    with get_db_connection() as conn:
+    with _connection() as conn:
+        cursor = conn.execute(f"SELECT {', '.join(Comment.COLUMNS)} FROM comments WHERE processed = 0")
+        return [Comment(*row) for row in cursor]
+
+def count_unprocessed() -> Tuple[int, int]:
+    """Counts the posts and comments that have not yet been processed.
+
+    Returns:
+        Tuple[int, int]: The number of unprocessed posts and comments.
+    """
+    with _connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT (SELECT COUNT(*) FROM posts WHERE processed = 0), "
+            "(SELECT COUNT(*) FROM comments WHERE processed = 0)"
+        )
+        return tuple(cursor.fetchone())
+
+def _iter_unprocessed(table: str, model, chunk_size: int):
+    """Yields unprocessed rows of `table` as `model` objects, `chunk_size` at a time.
+
+    Pages by rowid (`rowid > last_rowid`) rather than OFFSET so that every page
+    is an index seek, and only one page is held in memory at a time. Rows are
+    passed to `model` positionally, in its `COLUMNS` order.
+    """
+    query = (
+        f"SELECT rowid, {', '.join(model.COLUMNS)} FROM {table} "
+        "WHERE processed = 0 AND rowid > ? ORDER BY rowid LIMIT ?"
+    )
+    last_rowid = 0
+    with _connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT * FROM comments WHERE processed = 0")
-        return [Comment(**row) for row in cursor.fetchall()]
+        while True:
+            cursor.execute(query, (last_rowid, chunk_size))
+            rows = cursor.fetchall()
+            if not rows:
+                return
+            last_rowid = rows[-1][0]
+            yield [model(*row[1:]) for row in rows]
+
+def iter_unprocessed_posts(chunk_size: int = 256):
+    """Iterates over unprocessed posts in chunks.
+
+    Args:
+        chunk_size (int, optional): The number of posts per chunk. Defaults to 256.
+
+    Yields:
+        List[Post]: The next chunk of Post objects.
+    """
+    return _iter_unprocessed("posts", Post, chunk_size)
+
+def iter_unprocessed_comments(chunk_size: int = 256):
+    """Iterates over unprocessed comments in chunks.
+
+    Args:
+        chunk_size (int, optional): The number of comments per chunk. Defaults to 256.
+
+    Yields:
+        List[Comment]: The next chunk of Comment objects.
+    """
+    return _iter_unprocessed("comments", Comment, chunk_size)
+
+def iter_unprocessed_sources(page_size: int = 256):
+    """Streams every unprocessed post and comment through a single cursor.
 
-def save_pain_points(pain_points: List[PainPoint]):
-    """Saves a list of pain points to the database."""
-    if not pain_points:
-        return
+    Only the columns pain point detection needs are read, posts first, and
+    rows are fetched `page_size` at a time, so memory use stays flat however
+    many rows are unprocessed.
 
+    Args:
+        page_size (int, optional): The number of rows fetched at a time.
+            Defaults to 256.
+
+    Yields:
+        Tuple[str, str, Optional[str], Optional[str], Optional[str]]: A
+            (source_type, source_id, title, content, subreddit) tuple. The
+            title is None for comments.
+    """
+    # Always a connection of its own: callers mark the rows processed while
+    # this cursor is still scanning them.
     conn = get_db_connection()
     try:
-        cursor = conn.cursor()
-        
-        # Prepare data for bulk insertion
-        pain_point_data = [
-            (
-                pp.source_id,
-                pp.source_type,
-                pp.content,
-                pp.category,
-                pp.severity_score,
-                pp.confidence_score,
-                pp.sentiment_score,
-                pp.keywords,
-                pp.subreddit,
-                pp.engagement_score,
-            )
-            for pp in pain_points
-        ]
-        
-        insert_query = """
-        INSERT INTO pain_points (
-            source_id, source_type, content, category, severity_score, 
-            confidence_score, sentiment_score, keywords, subreddit, engagement_score
+        cursor = conn.execute(
+            "SELECT 'post', id, title, content, subreddit FROM posts WHERE processed = 0 "
+            "UNION ALL "
+            "SELECT 'comment', c.id, NULL, c.content, p.subreddit "
+            "FROM comments c LEFT JOIN posts p ON p.id = c.post_id WHERE c.processed = 0"
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
-        """
-        
-        cursor.executemany(insert_query, pain_point_data)
-        conn.commit()
-    except sqlite3.Error as e:
-        console.print(f"[bold red]Database error saving pain points: {e}[/bold red]")
-        conn.rollback()
+        while rows := cursor.fetchmany(page_size):
+            for row in rows:
+                yield tuple(row)
     finally:
         conn.close()
 
+def _mark_processed(conn, source_type: str, source_ids):
+    """Sets `processed` on the given posts or comments with one UPDATE.
+
+    The IDs are staged in a temporary table and joined against, so the
+    statements are the same whatever the number of IDs and stay clear of
+    SQLite's limit on bound parameters.
+    """
+    table = "posts" if source_type == "post" else "comments"
+    conn.execute("CREATE TEMP TABLE IF NOT EXISTS _pids(id TEXT PRIMARY KEY)")
+    conn.execute("DELETE FROM _pids")
+    conn.executemany("INSERT OR IGNORE INTO _pids VALUES (?)", ((source_id,) for source_id in source_ids))
+    conn.execute(f"UPDATE {table} SET processed = 1 WHERE id IN (SELECT id FROM _pids)")
+
+
+def save_pain_points(pain_points: List[PainPoint], connection=None, processed_sources=None, raise_errors: bool = False) -> int:
+    """Saves a list of pain points to the database in a single transaction.
+
+    Args:
+        pain_points (List[PainPoint]): The pain points to save, as PainPoint
+            objects or PainPointRow tuples.
+        connection (sqlite3.Connection, optional): The connection to use, which
+            is left open so callers saving many batches can reuse it. Defaults
+            to None, which uses the shared connection if there is one, else
+            opens (and closes) a new one.
+        processed_sources (Iterable[Tuple[str, str]], optional): (source_type,
+            source_id) pairs of the posts and comments that were analyzed,
+            including those with no pain points. They are marked processed in
+            the same transaction. Defaults to None, which marks nothing.
+        raise_errors (bool, optional): Whether a database error is raised to
+            the caller instead of being printed. Defaults to False.
+
+    Returns:
+        int: The number of pain points saved; 0 if the transaction failed.
+
+    Raises:
+        sqlite3.Error: If the transaction failed and `raise_errors` is set.
+    """
+    post_ids, comment_ids = [], []
+    for source_type, source_id in processed_sources or ():
+        (post_ids if source_type == "post" else comment_ids).append(source_id)
+    if not pain_points and not post_ids and not comment_ids:
+        return 0
+
+    insert_query = (
+        f"INSERT INTO pain_points ({', '.join(PainPoint.INSERT_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(PainPoint.INSERT_COLUMNS))})"
+    )
+    try:
+        # Each row's values are read by one attrgetter call, straight into executemany
+        with _connection(connection) as conn:
+            inserted = conn.executemany(insert_query, map(PainPoint._insert_values, pain_points)).rowcount
+            if post_ids:
+                _mark_processed(conn, "post", post_ids)
+            if comment_ids:
+                _mark_processed(conn, "comment", comment_ids)
+        invalidate_summary_bundle()
+        return inserted
+    except sqlite3.Error as e:
+        if raise_errors:
+            raise
+        console.print(f"[bold red]Database error saving pain points: {e}[/bold red]")
+        return 0
+
 
-def get_pain_points() -> List[Dict[str, Any]]:
+def get_pain_points(columns: Optional[Tuple[str, ...]] = None, page_size: int = 1000) -> List[Dict[str, Any]]:
     """Retrieves all pain points from the database.
 
+    Args:
+        columns (Tuple[str, ...], optional): The columns to load. Defaults to
+            None, which loads every column.
+        page_size (int, optional): The number of rows fetched from SQLite per
+            page. Defaults to 1000.
+
     Returns:
         List[Dict[str, Any]]: A list of dictionaries, where each dictionary
             represents a pain point.
     """
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM pain_points")
-        return [dict(row) for row in cursor.fetchall()]
+    if columns is None:
+        select = "*"
+    else:
+        unknown = set(columns).difference(('id',) + PainPoint.__slots__)
+        if unknown:
+            raise ValueError(f"Unknown pain point columns: {', '.join(sorted(unknown))}")
+        select = ", ".join(columns)
+
+    pain_points = []
+    with _connection() as conn:
+        cursor = conn.execute(f"SELECT {select} FROM pain_points")
+        while rows := cursor.fetchmany(page_size):
+            pain_points.extend(map(dict, rows))
+    return pain_points
+
+def iter_pain_points(page_size: int = 200):
+    """Iterates over all pain points, one page of rows at a time.
+
+    Args:
+        page_size (int, optional): The number of rows fetched from SQLite per
+            page. Defaults to 200.
 
-def save_opportunities(opportunities: List[Dict[str, Any]]):
-    """Saves a list of opportunity dictionaries to the database.
+    Yields:
+        Dict[str, Any]: The next pain point as a dictionary.
+    """
+    with _connection() as conn:
+        cursor = conn.execute("SELECT * FROM pain_points")
+        while rows := cursor.fetchmany(page_size):
+            for row in rows:
+                yield dict(row)
+
+def save_opportunities(opportunities: Iterable[Dict[str, Any]]) -> int:
+    """Saves opportunity dictionaries to the database in a single transaction.
+
+    The rows are streamed into one `executemany` call, so `opportunities`
+    can be a generator and no intermediate list of tuples is built.
 
     Args:
-        opportunities (List[Dict[str, Any]]): A list of dictionaries, each
-            representing an opportunity.
+        opportunities (Iterable[Dict[str, Any]]): The opportunities to save,
+            each represented as a dictionary.
+
+    Returns:
+        int: The number of opportunities inserted.
     """
-    opp_data = [(o['title'], o['description'], o['category'], o.get('market_score', 0), o['frequency_score'], o['willingness_to_pay_score'], o['total_score'], o['pain_point_count'], o.get('pain_point_ids', '[]')) for o in opportunities]
-    with get_db_connection() as conn:
-        cursor = conn.cursor()
-        cursor.executemany("INSERT INTO opportunities (title, description, category, market_score, frequency_score, willingness_to_pay_score, total_score, pain_point_count, pain_point_ids) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", opp_data)
-        conn.commit()
+    opp_data = (
+        (o['title'], o['description'], o['category'], o.get('market_score', 0), o['frequency_score'], o['willingness_to_pay_score'], o['total_score'], o['pain_point_count'], o.get('pain_point_ids', '[]'))
+        for o in opportunities
+    )
+    # Commits once on success and rolls the whole batch back on error
+    with _connection() as conn:
+        cursor = conn.executemany("INSERT INTO opportunities (title, description, category, market_score, frequency_score, willingness_to_pay_score, total_score, pain_point_count, pain_point_ids) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", opp_data)
+    inserted = cursor.rowcount
+    invalidate_category_distribution()
+    invalidate_summary_bundle()
+    return inserted
 
 def get_opportunities(limit: int = 20) -> List[Opportunity]:
     """Retrieves opportunities from the database, ordered by total score.
@@ -381,22 +763,152 @@ def get_opportunities(limit: int = 20) -> List[Opportunity]:
     Returns:
         List[Opportunity]: A list of Opportunity objects.
     """
-    with get_db_connection() as conn:
+    with _connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM opportunities ORDER BY total_score DESC LIMIT ?", (limit,))
         return [Opportunity(**row) for row in cursor.fetchall()]
 
+def iter_opportunities(limit: int = 1000, page_size: int = 200):
+    """Iterates over opportunities ordered by total score, one page of rows at a time.
+
+    Args:
+        limit (int, optional): The maximum number of opportunities to yield.
+            Defaults to 1000.
+        page_size (int, optional): The number of rows fetched from SQLite per
+            page. Defaults to 200.
+
+    Yields:
+        Opportunity: The next Opportunity object.
+    """
+    with _connection() as conn:
+        cursor = conn.execute("SELECT * FROM opportunities ORDER BY total_score DESC LIMIT ?", (limit,))
+        while rows := cursor.fetchmany(page_size):
+            for row in rows:
+                yield Opportunity(**row)
+
+def get_opportunities_rows(limit: int = 20, score_decimals: int = 3) -> List[Tuple[str, str, Optional[str], str, str]]:
+    """Retrieves the top opportunities as display-ready tuples of strings.
+
+    The values are formatted in SQL so the rows can be handed straight to a
+    table renderer without building Opportunity objects.
+
+    Args:
+        limit (int, optional): The maximum number of opportunities to retrieve.
+            Defaults to 20.
+        score_decimals (int, optional): The number of decimal places the total
+            score is formatted with. Defaults to 3.
+
+    Returns:
+        List[Tuple[str, str, Optional[str], str, str]]: One (id, title, category,
+            total score, pain point count) tuple per opportunity, ordered by
+            total score.
+    """
+    with _connection() as conn:
+        return conn.execute(
+            """
+            SELECT CAST(id AS TEXT), title, category, printf('%.*f', ?, total_score), CAST(pain_point_count AS TEXT)
+            FROM opportunities
+            ORDER BY total_score DESC
+            LIMIT ?
+            """,
+            (score_decimals, limit),
+        ).fetchall()
+
+def get_opportunity_count() -> int:
+    """Counts the opportunities in the database.
+
+    Returns:
+        int: The number of opportunities.
+    """
+    with _connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM opportunities").fetchone()[0]
+
+def get_pain_point_count() -> int:
+    """Counts the pain points in the database.
+
+    Returns:
+        int: The number of pain points.
+    """
+    with _connection() as conn:
+        return conn.execute("SELECT COUNT(*) FROM pain_points").fetchone()[0]
+
+# Category counts change only when opportunities are saved, so they are kept
+# in memory for a while. Holds (expires_at, distribution) or None.
+CATEGORY_DISTRIBUTION_TTL_SECONDS = 300
+_category_distribution_cache: Optional[Tuple[float, List[Tuple[str, int]]]] = None
+
+def invalidate_category_distribution():
+    """Discards the cached category distribution."""
+    global _category_distribution_cache
+    _category_distribution_cache = None
+
+def _category_distribution(cursor) -> List[Tuple[str, int]]:
+    """Returns the category distribution from the cache, querying with `cursor` on a miss."""
+    global _category_distribution_cache
+    now = time.monotonic()
+    if _category_distribution_cache is not None and _category_distribution_cache[0] > now:
+        return list(_category_distribution_cache[1])
+
+    cursor.execute("SELECT category, COUNT(*) FROM opportunities GROUP BY category ORDER BY 2 DESC, category")
+    distribution = [tuple(row) for row in cursor.fetchall()]
+    _category_distribution_cache = (now + CATEGORY_DISTRIBUTION_TTL_SECONDS, distribution)
+    return list(distribution)
+
+# Reports generated within a while of each other reuse one set of summary
+# queries. Holds (expires_at, top_limit, bundle) or None; discarded whenever
+# opportunities or pain points are saved.
+SUMMARY_BUNDLE_TTL_SECONDS = 300
+_summary_bundle_cache: Optional[Tuple[float, int, Tuple[List[Opportunity], int, int, List[Tuple[str, int]]]]] = None
+
+def invalidate_summary_bundle():
+    """Discards the cached summary bundle."""
+    global _summary_bundle_cache
+    _summary_bundle_cache = None
+
 def get_category_distribution() -> List[Tuple[str, int]]:
     """Gets the distribution of opportunities across different categories.
 
+    Results are cached for `CATEGORY_DISTRIBUTION_TTL_SECONDS` and refreshed
+    whenever opportunities are saved.
+
     Returns:
         List[Tuple[str, int]]: A list of tuples, where each tuple contains
-            a category name and the count of opportunities in that category.
+            a category name and the count of opportunities in that category,
+            largest first.
     """
-    with get_db_connection() as conn:
+    with _connection() as conn:
+        return _category_distribution(conn.cursor())
+
+def get_summary_bundle(top_limit: int = 5) -> Tuple[List[Opportunity], int, int, List[Tuple[str, int]]]:
+    """Fetches everything the summary report needs over a single connection.
+
+    Results are cached for `SUMMARY_BUNDLE_TTL_SECONDS` and refreshed
+    whenever opportunities or pain points are saved.
+
+    Args:
+        top_limit (int, optional): The number of top opportunities to include.
+            Defaults to 5.
+
+    Returns:
+        Tuple[List[Opportunity], int, int, List[Tuple[str, int]]]: The top
+            opportunities, the opportunity count, the pain point count and the
+            category distribution.
+    """
+    global _summary_bundle_cache
+    now = time.monotonic()
+    if _summary_bundle_cache is not None and _summary_bundle_cache[0] > now and _summary_bundle_cache[1] == top_limit:
+        top_opportunities, opportunity_count, pain_point_count, category_dist = _summary_bundle_cache[2]
+        return list(top_opportunities), opportunity_count, pain_point_count, list(category_dist)
+
+    with _connection() as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT category, COUNT(*) FROM opportunities GROUP BY category")
-        return cursor.fetchall()
+        cursor.execute("SELECT * FROM opportunities ORDER BY total_score DESC LIMIT ?", (top_limit,))
+        top_opportunities = [Opportunity(**row) for row in cursor.fetchall()]
+        cursor.execute("SELECT (SELECT COUNT(*) FROM opportunities), (SELECT COUNT(*) FROM pain_points)")
+        opportunity_count, pain_point_count = cursor.fetchone()
+        category_dist = _category_distribution(cursor)
+    _summary_bundle_cache = (now + SUMMARY_BUNDLE_TTL_SECONDS, top_limit, (top_opportunities, opportunity_count, pain_point_count, category_dist))
+    return list(top_opportunities), opportunity_count, pain_point_count, list(category_dist)
 
 def get_subreddit_for_post(post_id: str) -> Optional[str]:
     """Gets the subreddit for a given post ID.
@@ -407,7 +919,7 @@ def get_subreddit_for_post(post_id: str) -> Optional[str]:
     Returns:
         Optional[str]: The name of the subreddit, or None if not found.
     """
-    with get_db_connection() as conn:
+    with _connection() as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT subreddit FROM posts WHERE id = ?", (post_id,))
         result = cursor.fetchone()
@@ -2,16 +2,51 @@
 import praw
 from rich.console import Console
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
+import json
 import logging
+import os
+import threading
+import time
 
-from utils.config import ConfigManager
+from utils.config import get_config_manager
 from data.database import save_posts_and_comments
 
 console = Console()
 logging.basicConfig(filename='reddit_client.log', level=logging.ERROR, 
                     format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Records when each (subreddit, time filter, limit) scrape last completed, so
+# repeating it within SCRAPE_CACHE_TTL_SECONDS can skip the API calls; the
+# posts and comments from that scrape are already in the database.
+SCRAPE_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "reddit_saas_finder", "scrapes.json")
+SCRAPE_CACHE_TTL_SECONDS = 3600
+_scrape_cache_lock = threading.Lock()
+
+def _read_scrape_cache() -> Dict[str, float]:
+    """Returns the completion time of each cached scrape, keyed by scrape key."""
+    try:
+        with open(SCRAPE_CACHE_PATH, 'r') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+def _record_scrape(key: str):
+    """Marks the scrape identified by `key` as completed now, dropping expired entries."""
+    now = time.time()
+    with _scrape_cache_lock:
+        cache = {k: t for k, t in _read_scrape_cache().items() if now - t < SCRAPE_CACHE_TTL_SECONDS}
+        cache[key] = now
+        try:
+            os.makedirs(os.path.dirname(SCRAPE_CACHE_PATH), exist_ok=True)
+            tmp_path = f"{SCRAPE_CACHE_PATH}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, SCRAPE_CACHE_PATH)
+        except OSError:
+            pass  # The cache is only an optimization
+
 class RedditClient:
     """
     Manages all interactions with the Reddit API using the PRAW library.
@@ -19,16 +54,22 @@ class RedditClient:
     This class handles the authentication with Reddit, fetching posts and comments,
     and coordinating with the database module to save the scraped data.
     """
-    def __init__(self):
+    def __init__(self, credentials: Optional[Tuple[str, str, str]] = None):
         """
         Initializes the RedditClient.
 
         It fetches API credentials from the configuration and sets up a PRAW instance.
+
+        Args:
+            credentials (Tuple[str, str, str], optional): The (client_id,
+                client_secret, user_agent) to authenticate with. Defaults to
+                None, which uses the main credentials from the configuration.
+
         Raises:
             ValueError: If Reddit API credentials are not found in the configuration.
         """
-        config_manager = ConfigManager()
-        client_id, client_secret, user_agent = config_manager.get_reddit_credentials()
+        config_manager = get_config_manager()
+        client_id, client_secret, user_agent = credentials or config_manager.get_reddit_credentials()
         
         if not all([client_id, client_secret, user_agent]):
             console.print("[bold red]Missing Reddit API credentials in config or environment.[/bold red]")
@@ -42,23 +83,40 @@ class RedditClient:
         self.data_collection_config = config_manager.get_data_collection_config()
         console.print("RedditClient initialized successfully.", style="green")
 
-    def scrape_subreddit(self, subreddit_name: str, time_filter: str = 'week', limit: int = 100) -> None:
+    def scrape_subreddit(self, subreddit_name: str, time_filter: str = 'week', limit: int = 100, use_cache: bool = True) -> None:
         """
         Scrapes posts and their top comments from a given subreddit.
 
         The scraped data is then passed to the database module for storage.
+        An identical scrape that completed within the last
+        `SCRAPE_CACHE_TTL_SECONDS` is skipped unless `use_cache` is False.
 
         Args:
             subreddit_name (str): The name of the subreddit to scrape (e.g., 'SaaS').
             time_filter (str, optional): The time filter for sorting top posts
                 ('all', 'year', 'month', 'week', 'day'). Defaults to 'week'.
             limit (int, optional): The maximum number of posts to scrape. Defaults to 100.
+            use_cache (bool, optional): Whether a recent identical scrape may be
+                reused. Defaults to True.
         """
+        cache_key = f"{subreddit_name.lower()}|{time_filter}|{limit}"
+        if use_cache:
+            scraped_at = _read_scrape_cache().get(cache_key)
+            if scraped_at is not None and time.time() - scraped_at < SCRAPE_CACHE_TTL_SECONDS:
+                minutes = int((time.time() - scraped_at) // 60)
+                console.print(f"Skipping r/{subreddit_name}: already scraped with these settings {minutes} minute(s) ago.", style="yellow")
+                return
+
         console.print(f"Scraping r/{subreddit_name} (time: {time_filter}, limit: {limit})...", style="bold blue")
         subreddit = self.reddit.subreddit(subreddit_name)
         posts_data = []
         comments_data = []
         
+        max_comments = self.data_collection_config.get('max_comments_per_post', 100)
+
+        # Authors are read through `.name`, which PRAW fills in from the
+        # listing itself; touching any other Redditor attribute would fetch
+        # the user's profile with an extra request per author.
         try:
             for post in subreddit.top(time_filter=time_filter, limit=limit):
                 posts_data.append({
@@ -77,11 +135,10 @@ class RedditClient:
                 })
 
                 post.comments.replace_more(limit=0)
-                max_comments = self.data_collection_config.get('max_comments_per_post', 100)
                 for comment in post.comments.list()[:max_comments]:
                     comments_data.append({
                         'id': comment.id,
-                        'post_id': comment.submission.id,
+                        'post_id': post.id,
                         'body': comment.body,
                         'author': getattr(comment.author, 'name', '[deleted]'),
                         'score': comment.score,
@@ -95,6 +152,7 @@ class RedditClient:
             
             if posts_data or comments_data:
                 save_posts_and_comments(posts_data, comments_data)
+            _record_scrape(cache_key)
 
         except Exception as e:
             console.print(f"An error occurred while scraping r/{subreddit_name}: {e}", style="bold red")
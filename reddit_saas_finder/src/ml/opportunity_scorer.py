@@ -8,6 +8,7 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 from rich.progress import track
 import json
+import numpy as np
 import spacy
 
 from data.database import get_pain_points, save_opportunities
@@ -25,6 +26,9 @@ class OpportunityScorer:
     (market, frequency, willingness to pay), and generates a final
     opportunity score.
     """
+    # The pain point fields the scorer reads; other columns needn't be loaded.
+    PAIN_POINT_COLUMNS = ('id', 'source_id', 'content', 'category', 'subreddit')
+
     def __init__(self, pain_points, min_pain_points=5, min_score=0.5, similarity_threshold=0.7):
         """Initializes the OpportunityScorer."""
         self.pain_points = pain_points
@@ -32,12 +36,13 @@ class OpportunityScorer:
         self.min_score = min_score
         self.similarity_threshold = similarity_threshold
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            # Titles use noun chunks, POS tags and lemmas, but never entities
+            self.nlp = spacy.load("en_core_web_sm", exclude=["ner"])
         except OSError:
             logging.warning("spaCy model 'en_core_web_sm' not found. Downloading...")
             from spacy.cli import download
             download("en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", exclude=["ner"])
 
     def _group_similar_pain_points(self):
         """
@@ -67,23 +72,22 @@ class OpportunityScorer:
         similarity_matrix = cosine_similarity(tfidf_matrix)
         
         groups = []
-        visited = [False] * len(self.pain_points)
+        visited = np.zeros(len(self.pain_points), dtype=bool)
         
         for i in range(len(self.pain_points)):
             if visited[i]:
                 continue
             
-            # Start a new group with the current pain point
-            current_group = [self.pain_points[i]]
+            # Start a new group with the current pain point and every later,
+            # still ungrouped pain point similar enough to it, found with one
+            # vectorized comparison over the row instead of a loop over j.
+            similar = np.flatnonzero(
+                (similarity_matrix[i, i + 1:] >= self.similarity_threshold) & ~visited[i + 1:]
+            ) + i + 1
             visited[i] = True
+            visited[similar] = True
             
-            # Find similar pain points
-            for j in range(i + 1, len(self.pain_points)):
-                if not visited[j] and similarity_matrix[i, j] >= self.similarity_threshold:
-                    current_group.append(self.pain_points[j])
-                    visited[j] = True
-            
-            groups.append(current_group)
+            groups.append([self.pain_points[i]] + [self.pain_points[j] for j in similar])
             
         return groups
 
@@ -1,13 +1,15 @@
 """Detects trends using machine learning.""" 
 
+import calendar
+import json
 import sqlite3
-import pandas as pd
 from datetime import datetime, timedelta
-from sklearn.linear_model import LinearRegression
-import numpy as np
 
 from data.database import get_db_connection
 
+# Index 1-12 holds the month names; index 0 is an empty string.
+_MONTHS = calendar.month_name
+
 class TrendDetector:
     """
     Analyzes time-series data to detect trends, seasonality, and predict growth.
@@ -38,77 +40,49 @@ class TrendDetector:
             list: A list of dictionaries, each containing opportunity details
                   and its calculated trend ('increasing', 'decreasing', 'stable').
         """
+        import numpy as np
+        import pandas as pd
+
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=days)
-        
+        mid_point_date = start_date + timedelta(days=days/2)
+
+        # The half-period counts are aggregated by SQLite in one pass over the
+        # join. Pain points outside the window are left unmatched, so every
+        # opportunity with pain points is still reported.
         query = """
         SELECT
             o.id,
             o.title,
             o.total_score,
-            p.created_utc
+            COUNT(pp.created_utc) AS mentions,
+            COALESCE(SUM(JULIANDAY(pp.created_utc) < JULIANDAY(:mid)), 0) AS first_half_count,
+            COALESCE(SUM(JULIANDAY(pp.created_utc) >= JULIANDAY(:mid)), 0) AS second_half_count
         FROM opportunities o
-        JOIN json_each(o.pain_point_ids) j ON 1
-        JOIN pain_points pp ON pp.id = j.value
-        -- Joining with both posts and comments to get creation time
-        LEFT JOIN posts p ON pp.source_type = 'post' AND pp.source_id = p.id
-        LEFT JOIN comments c ON pp.source_type = 'comment' AND pp.source_id = c.id
-        WHERE COALESCE(p.created_utc, c.created_utc) >= ?
+        JOIN json_each(o.pain_point_ids) j
+        LEFT JOIN (
+            SELECT
+                pp.id,
+                s.created_utc
+            FROM pain_points pp
+            JOIN source_created s ON s.id = pp.source_id AND s.source_type = pp.source_type
+            WHERE s.created_utc IS NOT NULL
+              AND DATETIME(s.created_utc) >= DATETIME(:start)
+        ) pp ON pp.id = j.value
+        GROUP BY o.id
+        ORDER BY o.id
         """
-        
-        # The above query is not quite right because pain_points doesn't have created_utc
-        # and joining posts and comments and using COALESCE is tricky.
-        # Let's get pain points with their creation dates first.
 
-        pain_points_query = """
-        SELECT
-            pp.id,
-            COALESCE(p.created_utc, c.created_utc) as created_utc
-        FROM pain_points pp
-        LEFT JOIN posts p ON pp.source_type = 'post' AND pp.source_id = p.id
-        LEFT JOIN comments c ON pp.source_type = 'comment' AND pp.source_id = c.id
-        WHERE COALESCE(p.created_utc, c.created_utc) IS NOT NULL
-          AND DATETIME(COALESCE(p.created_utc, c.created_utc)) >= DATETIME(?)
-        """
+        counts = pd.read_sql_query(query, self.conn, params={"start": start_date, "mid": mid_point_date})
+        first, second = counts['first_half_count'], counts['second_half_count']
+        # Simple trend calculation: compare first half vs second half, 20% either way
+        counts['trend'] = np.select(
+            [counts['mentions'] < 2, second > first * 1.2, first > second * 1.2],
+            ["stable", "increasing", "decreasing"],
+            default="stable",
+        )
 
-        df_pain_points = pd.read_sql_query(pain_points_query, self.conn, params=(start_date,))
-        df_pain_points['created_utc'] = pd.to_datetime(df_pain_points['created_utc'])
-
-        opportunities_query = "SELECT id, title, total_score, pain_point_ids FROM opportunities"
-        df_opportunities = pd.read_sql_query(opportunities_query, self.conn)
-        
-        results = []
-
-        for _, opp in df_opportunities.iterrows():
-            pain_point_ids = pd.read_json(opp['pain_point_ids'])
-            if not len(pain_point_ids):
-                continue
-            
-            opp_pain_points_df = df_pain_points[df_pain_points['id'].isin(pain_point_ids[0])]
-            
-            if len(opp_pain_points_df) < 2:
-                trend = "stable"
-            else:
-                # Simple trend calculation: compare first half vs second half
-                mid_point_date = start_date + timedelta(days=days/2)
-                first_half_count = opp_pain_points_df[opp_pain_points_df['created_utc'] < mid_point_date].shape[0]
-                second_half_count = opp_pain_points_df[opp_pain_points_df['created_utc'] >= mid_point_date].shape[0]
-
-                if second_half_count > first_half_count * 1.2: # 20% increase
-                    trend = "increasing"
-                elif first_half_count > second_half_count * 1.2: # 20% decrease
-                    trend = "decreasing"
-                else:
-                    trend = "stable"
-
-            results.append({
-                "id": opp["id"],
-                "title": opp["title"],
-                "total_score": opp["total_score"],
-                "trend": trend,
-            })
-            
-        return results
+        return counts[['id', 'title', 'total_score', 'trend']].to_dict('records')
 
     def detect_seasonal_patterns(self) -> dict:
         """
@@ -122,24 +96,15 @@ class TrendDetector:
         """
         query = """
         SELECT
-            STRFTIME('%m', COALESCE(p.created_utc, c.created_utc)) as month,
+            STRFTIME('%m', s.created_utc) as month,
             COUNT(pp.id) as count
         FROM pain_points pp
-        LEFT JOIN posts p ON pp.source_type = 'post' AND pp.source_id = p.id
-        LEFT JOIN comments c ON pp.source_type = 'comment' AND pp.source_id = c.id
+        JOIN source_created s ON s.id = pp.source_id AND s.source_type = pp.source_type
         WHERE month IS NOT NULL
         GROUP BY month
         ORDER BY month
         """
-        df = pd.read_sql_query(query, self.conn)
-        
-        month_map = {
-            "01": "January", "02": "February", "03": "March", "04": "April",
-            "05": "May", "06": "June", "07": "July", "08": "August",
-            "09": "September", "10": "October", "11": "November", "12": "December"
-        }
-        
-        return {month_map[row['month']]: row['count'] for _, row in df.iterrows()}
+        return {_MONTHS[int(month)]: count for month, count in self.conn.execute(query) if month}
 
     def predict_opportunity_growth(self, opportunity_id: int) -> float:
         """
@@ -156,18 +121,9 @@ class TrendDetector:
                    Returns 0.0 if the opportunity is not found or has no data.
                    Returns 0.5 if there is insufficient data for a prediction.
         """
-        
-        query = """
-        SELECT
-            pp.id,
-            COALESCE(p.created_utc, c.created_utc) as created_utc
-        FROM pain_points pp
-        JOIN opportunities o ON json_extract(o.pain_point_ids, '$[0]') = pp.id AND o.id = ?
-        LEFT JOIN posts p ON pp.source_type = 'post' AND pp.source_id = p.id
-        LEFT JOIN comments c ON pp.source_type = 'comment' AND pp.source_id = c.id
-        WHERE created_utc IS NOT NULL
-        """
-        # This query is also wrong. I need to get all pain points for an opportunity.
+        import numpy as np
+        import pandas as pd
+
         opp_query = "SELECT pain_point_ids FROM opportunities WHERE id = ?"
         cursor = self.conn.cursor()
         cursor.execute(opp_query, (opportunity_id,))
@@ -175,7 +131,7 @@ class TrendDetector:
         if not row:
             return 0.0
 
-        pain_point_ids = tuple(pd.read_json(row[0])[0].tolist())
+        pain_point_ids = tuple(json.loads(row[0] or '[]'))
 
         if not pain_point_ids:
             return 0.0
@@ -183,11 +139,11 @@ class TrendDetector:
         placeholders = ', '.join('?' for _ in pain_point_ids)
         pain_points_query = f"""
         SELECT
-            COALESCE(p.created_utc, c.created_utc) as created_utc
+            s.created_utc
         FROM pain_points pp
-        LEFT JOIN posts p ON pp.source_type = 'post' AND pp.source_id = p.id
-        LEFT JOIN comments c ON pp.source_type = 'comment' AND pp.source_id = c.id
+        JOIN source_created s ON s.id = pp.source_id AND s.source_type = pp.source_type
         WHERE pp.id IN ({placeholders})
+          AND s.created_utc IS NOT NULL
         """
 
         df = pd.read_sql_query(pain_points_query, self.conn, params=pain_point_ids)
@@ -197,16 +153,12 @@ class TrendDetector:
         if len(df) < 5:
             return 0.5 # Not enough data, neutral prediction
 
-        df['time'] = (df['created_utc'] - df['created_utc'].min()).dt.days
-        
-        X = df[['time']]
-        y = df['count']
-        
-        model = LinearRegression()
-        model.fit(X, y)
-        
-        # The slope of the regression line indicates the trend
-        slope = model.coef_[0]
+        x = (df['created_utc'] - df['created_utc'].min()).dt.days.to_numpy(dtype=float)
+        y = df['count'].to_numpy(dtype=float)
+
+        # The slope of the least-squares regression line indicates the trend
+        x_centered = x - x.mean()
+        slope = (x_centered * (y - y.mean())).sum() / (x_centered ** 2).sum()
         
         # Normalize slope to a 0-1 probability-like score
         # This is a simple heuristic. A positive slope means growth.
@@ -1,5 +1,5 @@
 """Categorizes text into predefined categories."""
-from utils.config import ConfigManager
+from utils.config import get_config_manager
 import yaml
 from rich.console import Console
 
@@ -16,8 +16,15 @@ class Categorizer:
 
         Loads the category-keyword mappings from the application configuration.
         """
-        config_manager = ConfigManager()
+        config_manager = get_config_manager()
         self.categories = config_manager.config.get('categories', {})
+        # Every (keyword, category) pair in category order, so classifying is
+        # one flat loop of substring tests with no generator per category.
+        self._keyword_categories = tuple(
+            (keyword, category)
+            for category, keywords in self.categories.items()
+            for keyword in keywords
+        )
 
     def classify_problem_category(self, text: str):
         """
@@ -34,7 +41,7 @@ class Categorizer:
                  from any category are found.
         """
         text_lower = text.lower()
-        for category, keywords in self.categories.items():
-            if any(keyword in text_lower for keyword in keywords):
+        for keyword, category in self._keyword_categories:
+            if keyword in text_lower:
                 return category
         return 'other' 
\ No newline at end of file
@@ -0,0 +1,175 @@
+"""Keeps a pain point detector loaded in a resident worker process."""
+import os
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client, Listener, answer_challenge, deliver_challenge
+
+from rich.console import Console
+
+console = Console()
+
+# The worker listens on a Unix socket per detector type, created readable and
+# writable by the current user only. Clients authenticate with a random key
+# the worker writes next to the socket, with the same permissions.
+SOCKET_DIR = os.path.join(os.path.expanduser("~"), ".cache", "reddit_saas_finder")
+# How long a client waits for the worker to take its connection before
+# detecting in its own process instead; the worker serves one client at a time.
+CONNECT_TIMEOUT_SECONDS = 2.0
+
+def get_socket_path(advanced: bool) -> str:
+    """Returns the socket path of the worker for the given detector type."""
+    kind = "advanced" if advanced else "basic"
+    return os.path.join(SOCKET_DIR, f"pain-detector-{kind}.sock")
+
+def get_key_path(advanced: bool) -> str:
+    """Returns the path of the authentication key of the worker for the given detector type."""
+    return os.path.splitext(get_socket_path(advanced))[0] + ".key"
+
+def _open_connection(socket_path: str):
+    """Connects to the socket at `socket_path`, returning None if nothing is listening."""
+    try:
+        return Client(socket_path, family='AF_UNIX')
+    except OSError:
+        return None
+
+def serve_detector(advanced: bool = False):
+    """
+    Loads the detector once and answers detection requests until interrupted.
+
+    Clients are served one at a time, and are sent an authentication
+    challenge when their turn starts; nothing is unpickled from a client
+    until it has answered. Each request is a list of texts; the reply is
+    ("ok", result of `extract_pain_points_batch`) or ("error", message) if
+    detection failed.
+
+    Args:
+        advanced (bool, optional): Whether to serve the transformer-based
+            detector. Defaults to False.
+    """
+    socket_path = get_socket_path(advanced)
+    # Any connection at all means a worker is listening, even if it is busy
+    existing = _open_connection(socket_path) if os.path.exists(socket_path) else None
+    if existing is not None:
+        existing.close()
+        console.print(f"[bold yellow]A detector worker is already listening on {socket_path}.[/bold yellow]")
+        return
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)  # Left behind by a worker that didn't shut down cleanly
+
+    from nlp.pain_detector import get_pain_detector
+
+    detector = get_pain_detector(advanced)
+    os.makedirs(SOCKET_DIR, exist_ok=True)
+    authkey = os.urandom(32)
+    old_umask = os.umask(0o177)
+    try:
+        with open(get_key_path(advanced), 'wb') as f:
+            f.write(authkey)
+        listener = Listener(socket_path, family='AF_UNIX', authkey=authkey)
+    finally:
+        os.umask(old_umask)
+
+    console.print(f"[bold green]Pain point detector worker ready on {socket_path}.[/bold green]")
+    with listener:
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, EOFError, OSError):
+                continue  # A client without the key, or one that gave up waiting
+            with conn:
+                try:
+                    while True:
+                        texts = conn.recv()
+                        try:
+                            reply = ("ok", detector.extract_pain_points_batch(texts))
+                        except Exception as e:
+                            console.print(f"[bold red]Detector worker request failed: {e}[/bold red]")
+                            reply = ("error", str(e))
+                        conn.send(reply)
+                except (EOFError, OSError):
+                    pass  # The client finished its run, or gave up waiting
+
+class RemoteDetector:
+    """
+    Runs detection in a resident worker started with `serve_detector`.
+
+    If the worker goes away mid-run, detection falls back to a detector
+    loaded in this process. A batch the worker failed on raises instead.
+    """
+    def __init__(self, conn, advanced: bool):
+        """
+        Initializes the RemoteDetector.
+
+        Args:
+            conn (multiprocessing.connection.Connection): A connection to the worker.
+            advanced (bool): Whether the worker serves the transformer-based detector.
+        """
+        self.conn = conn
+        self.advanced = advanced
+        self.local_detector = None
+
+    def extract_pain_points_batch(self, texts: list):
+        """
+        Extracts pain points from several texts in the worker.
+
+        Args:
+            texts (list): The texts to analyze.
+
+        Returns:
+            list: One list of pain point dictionaries per text, in order.
+
+        Raises:
+            RuntimeError: If detection failed in the worker.
+        """
+        if self.local_detector is None:
+            try:
+                self.conn.send(texts)
+                status, result = self.conn.recv()
+            except (OSError, EOFError):
+                console.print("[bold yellow]Lost the detector worker; loading the detector in this process.[/bold yellow]")
+                from nlp.pain_detector import get_pain_detector
+                self.local_detector = get_pain_detector(self.advanced)
+            else:
+                if status == "error":
+                    raise RuntimeError(f"Detector worker failed: {result}")
+                return result
+        return self.local_detector.extract_pain_points_batch(texts)
+
+    def extract_pain_points(self, text: str):
+        """Extracts pain points from a single text in the worker."""
+        return self.extract_pain_points_batch([text])[0]
+
+def connect_detector(advanced: bool):
+    """
+    Connects to a running detector worker, if there is one.
+
+    Args:
+        advanced (bool): Whether to look for the transformer-based detector's worker.
+
+    Returns:
+        RemoteDetector: A detector backed by the worker, or None if no worker
+            is listening or it is still busy with another client after
+            CONNECT_TIMEOUT_SECONDS.
+    """
+    socket_path = get_socket_path(advanced)
+    if not os.path.exists(socket_path):
+        return None
+    try:
+        with open(get_key_path(advanced), 'rb') as f:
+            authkey = f.read()
+    except OSError:
+        return None
+    conn = _open_connection(socket_path)
+    if conn is None:
+        return None
+    try:
+        # The worker sends its challenge when it starts serving this client;
+        # the handshake is the one Client(authkey=...) does, after waiting
+        # for it with a timeout instead of blocking on a busy worker.
+        if conn.poll(CONNECT_TIMEOUT_SECONDS):
+            answer_challenge(conn, authkey)
+            deliver_challenge(conn, authkey)
+            return RemoteDetector(conn, advanced)
+    except (AuthenticationError, OSError, EOFError):
+        pass
+    conn.close()
+    return None
@@ -1,11 +1,14 @@
 """Detects pain points in text."""
+import contextlib
+import functools
+import os
 import spacy
 import re
 from rich.console import Console
 from transformers import pipeline, logging as transformers_logging
 import warnings
 from utils.keywords import KeywordManager
-from utils.performance import PerformanceOptimizer
+from utils.performance import PerformanceOptimizer, get_inference_device, quantize_for_cpu
 
 # Suppress verbose logging from transformers
 transformers_logging.set_verbosity_error()
@@ -13,6 +16,44 @@ warnings.filterwarnings("ignore", category=UserWarning, module="transformers")
 
 console = Console()
 
+# Using a model fine-tuned for sentiment analysis on Twitter data, which is similar to Reddit's informal text.
+SENTIMENT_MODEL = "cardiffnlp/twitter-roberta-base-sentiment-latest"
+# Where the ONNX export of SENTIMENT_MODEL is kept when `optimum` is installed.
+ONNX_MODEL_DIR = os.path.join(os.path.expanduser("~"), ".cache", "reddit_saas_finder", "onnx", "twitter-roberta-base-sentiment")
+# Pain point detection only needs sentence boundaries, which come from the
+# parser; the other en_core_web_sm components are not loaded at all.
+SPACY_EXCLUDE = ["tagger", "attribute_ruler", "lemmatizer", "ner"]
+# Candidate sentences are truncated to this many tokens before classification,
+# which keeps padded batches small when one sentence is unusually long.
+MAX_SEQUENCE_LENGTH = 256
+
+def _inference_mode():
+    """Returns `torch.inference_mode()` when PyTorch is installed, else a no-op context."""
+    try:
+        import torch
+    except ImportError:
+        return contextlib.nullcontext()
+    return torch.inference_mode()
+
+@functools.lru_cache(maxsize=8)
+def _compile_patterns(patterns: tuple):
+    """
+    Compiles the pain point patterns for matching against sentences.
+
+    Args:
+        patterns (tuple): The pain point regular expressions, in priority order.
+
+    Returns:
+        tuple: A (combined, compiled) pair. `combined` matches wherever any of
+            the patterns does, in one scan of the sentence, or is None if there
+            are no patterns; `compiled` is each pattern compiled on its own.
+    """
+    compiled = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+    if not patterns:
+        return None, compiled
+    combined = re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+    return combined, compiled
+
 class BasicPainDetector:
     """
     Detects pain points in text using keyword matching and basic NLP.
@@ -28,12 +69,12 @@ class BasicPainDetector:
         and load the pain point keywords.
         """
         try:
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", exclude=SPACY_EXCLUDE)
         except OSError:
             console.print("[bold yellow]spaCy model 'en_core_web_sm' not found. Downloading...[/bold yellow]")
             from spacy.cli import download
             download("en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
+            self.nlp = spacy.load("en_core_web_sm", exclude=SPACY_EXCLUDE)
             
         self.keyword_manager = KeywordManager()
         self.pain_point_patterns = self.keyword_manager.get_pain_point_keywords()
@@ -49,18 +90,42 @@ class BasicPainDetector:
             list: A list of dictionaries, where each dictionary represents a
                   detected pain point and includes the content and the matched pattern.
         """
-        pain_points = []
-        doc = self.nlp(text)
-        
+        return self.extract_pain_points_batch([text])[0]
+
+    def extract_pain_points_batch(self, texts: list):
+        """
+        Extracts pain point sentences from several texts at once.
+
+        The texts are parsed with a single `nlp.pipe` call, which batches the
+        spaCy pipeline instead of running it once per text.
+
+        Args:
+            texts (list): The texts to analyze.
+
+        Returns:
+            list: One list of pain point dictionaries per text, in order.
+        """
         # Refresh patterns in case they were updated
         self.pain_point_patterns = self.keyword_manager.get_pain_point_keywords()
 
-        for sent in doc.sents:
-            for pattern in self.pain_point_patterns:
-                if re.search(pattern, sent.text, re.IGNORECASE):
-                    pain_points.append({'content': sent.text, 'pattern': pattern})
-                    break # Move to the next sentence after finding one match
-        return pain_points
+        combined, compiled = _compile_patterns(tuple(self.pain_point_patterns))
+
+        results = []
+        for doc in self.nlp.pipe(texts):
+            pain_points = []
+            if combined is not None:
+                for sent in doc.sents:
+                    # Most sentences match nothing, which the combined pattern
+                    # rules out in one scan; only matches look for the first
+                    # pattern responsible.
+                    if not combined.search(sent.text):
+                        continue
+                    for pattern, regex in zip(self.pain_point_patterns, compiled):
+                        if regex.search(sent.text):
+                            pain_points.append({'content': sent.text, 'pattern': pattern})
+                            break # Move to the next sentence after finding one match
+            results.append(pain_points)
+        return results
 
 class AdvancedPainDetector(BasicPainDetector):
     """
@@ -81,16 +146,49 @@ class AdvancedPainDetector(BasicPainDetector):
         super().__init__()
         self.optimizer = PerformanceOptimizer()
         try:
-            # Using a model fine-tuned for sentiment analysis on Twitter data, which is similar to Reddit's informal text.
-            self.sentiment_classifier = pipeline(
-                "sentiment-analysis", 
-                model="cardiffnlp/twitter-roberta-base-sentiment-latest"
-            )
+            self.sentiment_classifier = self._load_sentiment_classifier()
         except Exception as e:
             console.print(f"[bold red]Failed to load transformer model: {e}[/bold red]")
             console.print("[bold yellow]Falling back to basic pain point detection.[/bold yellow]")
             self.sentiment_classifier = None
 
+    def _load_sentiment_classifier(self):
+        """
+        Builds the sentiment analysis pipeline.
+
+        On CPU, when `optimum[onnxruntime]` is installed, the model runs on
+        ONNX Runtime, which is usually several times faster there than
+        PyTorch. It is exported to ONNX on first use and saved to
+        `ONNX_MODEL_DIR` for later runs. Otherwise the PyTorch model is used,
+        with its Linear layers quantized to int8 when running on CPU.
+
+        Returns:
+            The Transformers sentiment analysis pipeline.
+        """
+        device = get_inference_device()
+        if device == -1:
+            try:
+                from optimum.onnxruntime import ORTModelForSequenceClassification
+                from transformers import AutoTokenizer
+            except ImportError:
+                pass
+            else:
+                if os.path.isdir(ONNX_MODEL_DIR):
+                    model = ORTModelForSequenceClassification.from_pretrained(ONNX_MODEL_DIR)
+                    tokenizer = AutoTokenizer.from_pretrained(ONNX_MODEL_DIR)
+                else:
+                    console.print("Exporting the sentiment model to ONNX (first run only)...")
+                    model = ORTModelForSequenceClassification.from_pretrained(SENTIMENT_MODEL, export=True)
+                    tokenizer = AutoTokenizer.from_pretrained(SENTIMENT_MODEL)
+                    model.save_pretrained(ONNX_MODEL_DIR)
+                    tokenizer.save_pretrained(ONNX_MODEL_DIR)
+                return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer)
+
+        classifier = pipeline("sentiment-analysis", model=SENTIMENT_MODEL, device=device)
+        if device == -1:
+            classifier.model = quantize_for_cpu(classifier.model)
+        return classifier
+
     def extract_pain_points(self, text: str):
         """
         Extracts pain points using a hybrid approach of keyword matching and
@@ -107,30 +205,82 @@ class AdvancedPainDetector(BasicPainDetector):
             list: A list of dictionaries for each confirmed pain point, including
                   content and confidence score.
         """
+        return self.extract_pain_points_batch([text])[0]
+
+    def extract_pain_points_batch(self, texts: list, batch_size: int = 32):
+        """
+        Extracts pain points from several texts at once.
+
+        The texts are parsed with one `nlp.pipe` call, and the keyword-matching
+        sentences from all of them are classified in a single batched call to
+        the transformer model, under `torch.inference_mode()`. Falls back to
+        the batched basic detector if the transformer model is not available.
+
+        Args:
+            texts (list): The texts to analyze.
+            batch_size (int, optional): The number of sentences the model
+                classifies per forward pass. Defaults to 32.
+
+        Returns:
+            list: One list of pain point dictionaries per text, in order.
+        """
         if not self.sentiment_classifier:
-            return super().extract_pain_points(text)
+            return super().extract_pain_points_batch(texts)
 
-        cached_result = self.optimizer.get_cached_nlp_result(text)
-        if cached_result:
-            return cached_result
+        results = [self.optimizer.get_cached_nlp_result(text) for text in texts]
+        misses = [i for i, cached in enumerate(results) if not cached]
 
-        pain_points = []
-        doc = self.nlp(text)
-        
         # Refresh patterns in case they were updated
         self.pain_point_patterns = self.keyword_manager.get_pain_point_keywords()
 
-        for sent in doc.sents:
-            # First, do a quick check with basic patterns to reduce the number of expensive model calls.
-            if any(re.search(pattern, sent.text, re.IGNORECASE) for pattern in self.pain_point_patterns):
-                result = self.sentiment_classifier(sent.text)[0]
+        combined, _ = _compile_patterns(tuple(self.pain_point_patterns))
+
+        # First, do a quick check with basic patterns to reduce the number of expensive model calls.
+        candidates = []  # (text index, sentence) pairs
+        for i, doc in zip(misses, self.nlp.pipe(texts[i] for i in misses)):
+            results[i] = []
+            if combined is None:
+                continue
+            for sent in doc.sents:
+                if combined.search(sent.text):
+                    candidates.append((i, sent.text))
+
+        if candidates:
+            # inference_mode also skips the autograd version-counter bookkeeping
+            # that the pipeline's own no_grad() still does.
+            with _inference_mode():
+                predictions = self.sentiment_classifier(
+                    [sentence for _, sentence in candidates],
+                    batch_size=batch_size, truncation=True, max_length=MAX_SEQUENCE_LENGTH
+                )
+            for (i, sentence), result in zip(candidates, predictions):
                 # We consider 'negative' sentiment as a strong indicator of a pain point.
                 if result['label'] == 'negative' and result['score'] > 0.6: # Confidence threshold
-                    pain_points.append({
-                        'content': sent.text,
+                    results[i].append({
+                        'content': sentence,
                         'confidence': result['score'],
                         'pattern': 'transformer-detected'
                     })
-        
-        self.optimizer.cache_nlp_result(text, pain_points)
-        return pain_points 
\ No newline at end of file
+
+        for i in misses:
+            self.optimizer.cache_nlp_result(texts[i], results[i])
+        return results
+
+
+@functools.lru_cache(maxsize=2)
+def get_pain_detector(advanced: bool = False):
+    """
+    Returns a pain point detector shared by the whole process.
+
+    The spaCy and transformer models are loaded once per detector type, not
+    once per call.
+
+    Args:
+        advanced (bool, optional): Whether to return the transformer-based
+            detector. Defaults to False.
+
+    Returns:
+        BasicPainDetector: An AdvancedPainDetector if `advanced` is set, otherwise
+            a BasicPainDetector.
+    """
+    return AdvancedPainDetector() if advanced else BasicPainDetector()
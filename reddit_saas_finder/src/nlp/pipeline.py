@@ -0,0 +1,95 @@
+"""Reads unprocessed sources in batches and extracts their pain points."""
+from itertools import islice
+
+from rich.console import Console
+from data.database import iter_unprocessed_sources, PainPointRow
+
+console = Console()
+
+# Number of posts or comments run through the detector and written per batch.
+BATCH_SIZE = 256
+# Detection results kept per distinct text, so repeated boilerplate comments
+# ("This.", bot signatures, quoted text) are run through the detector once.
+DEDUP_CACHE_SIZE = 10_000
+
+def iter_sources():
+    """
+    Yields every unprocessed post and comment, with the text to analyze.
+
+    Sources with no text are yielded too, with an empty text, so they are
+    marked processed along with the rest of their batch.
+
+    Yields:
+        tuple: A (source_type, source_id, text, subreddit) tuple, posts first.
+            A post's text is its title and content joined.
+    """
+    for source_type, source_id, title, content, subreddit in iter_unprocessed_sources(BATCH_SIZE):
+        # One allocation for the joined text; isspace() checks it without copying
+        text = " ".join(filter(None, (title, content))) if source_type == 'post' else content
+        if not text or text.isspace():
+            text = ""
+        yield source_type, source_id, text, subreddit
+
+def chunked(iterable, size):
+    """Yields successive lists of at most `size` items from `iterable`."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+def extract_batch(detector, categorizer, batch, seen=None):
+    """
+    Runs the detector over a batch of sources and builds their pain points.
+
+    Each distinct text is only run through the detector once: repeats within
+    the batch, or of a text recorded in `seen`, reuse the earlier result.
+    Sources with an empty text have no pain points and skip the detector.
+
+    Args:
+        detector: The pain point detector to use.
+        categorizer: The categorizer used to classify each pain point.
+        batch (list): (source_type, source_id, text, subreddit) tuples from
+            `iter_sources`.
+        seen (dict, optional): Detection results by text from earlier batches,
+            updated with this batch's. Holds at most DEDUP_CACHE_SIZE texts,
+            oldest dropped first. Defaults to None.
+
+    Returns:
+        tuple: The PainPointRow tuples found in the batch, and the
+            (source_type, source_id) pairs of the sources analyzed. No
+            sources are reported if the detector failed on the batch, so
+            they are retried on the next run.
+    """
+    if seen is None:
+        seen = {}
+    texts = [text for _, _, text, _ in batch]
+    new_texts = list(dict.fromkeys(text for text in texts if text and text not in seen))
+    try:
+        if new_texts:
+            seen.update(zip(new_texts, detector.extract_pain_points_batch(new_texts)))
+        extracted_batch = [seen[text] if text else () for text in texts]
+    except Exception as e:
+        console.print(f"[bold red]Failed to process a batch of {len(batch)} sources: {e}[/bold red]")
+        return [], []
+    finally:
+        for text in list(islice(seen, max(0, len(seen) - DEDUP_CACHE_SIZE))):
+            del seen[text]
+
+    pain_points = []
+    for (source_type, source_id, _, subreddit), extracted in zip(batch, extracted_batch):
+        try:
+            for pp in extracted:
+                category = categorizer.classify_problem_category(pp['content'])
+                pain_points.append(
+                    PainPointRow(
+                        source_id=source_id,
+                        source_type=source_type,
+                        content=pp['content'],
+                        category=category,
+                        subreddit=subreddit,
+                        severity_score=pp.get('confidence', 0.5),
+                        confidence_score=pp.get('confidence', 0.5)
+                    )
+                )
+        except Exception as e:
+            console.print(f"[bold red]Failed to process {source_type} {source_id}: {e}[/bold red]")
+    return pain_points, [(source_type, source_id) for source_type, source_id, _, _ in batch]
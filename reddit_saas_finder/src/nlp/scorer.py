@@ -1,10 +1,15 @@
 """Calculates various NLP-based scores."""
-from transformers import pipeline, logging as transformers_logging
-import warnings
+import functools
+import re
 
-# Suppress verbose logging from transformers
-transformers_logging.set_verbosity_error()
-warnings.filterwarnings("ignore", category=UserWarning, module="transformers")
+# Words that boost the severity of a pain point. Both groups are matched in a
+# single pass; group 1 captures intensity words and group 2 urgency words.
+# A word must start at a word boundary ('every' is not 'very') but may carry
+# any suffix, so 'needs', 'hated' and 'urgently' boost as they always have.
+_BOOST_WORDS_RE = re.compile(
+    r'\b(?:(extremely|really|very|completely|totally|hate)'
+    r'|(urgent|asap|immediately|critical|emergency|need))'
+)
 
 
 class SentimentScorer:
@@ -17,9 +22,26 @@ class SentimentScorer:
     def __init__(self):
         """Initializes the SentimentScorer.
 
-        Loads a pre-trained sentiment analysis pipeline from the Transformers library.
+        The sentiment analysis pipeline is loaded lazily on first use.
         """
-        self.sentiment_analyzer = pipeline("sentiment-analysis")
+        self._analyzer = None
+
+    @property
+    def sentiment_analyzer(self):
+        """The Transformers sentiment analysis pipeline, loaded on first access."""
+        if self._analyzer is None:
+            import warnings
+            from transformers import pipeline, logging as transformers_logging
+            from utils.performance import get_inference_device, quantize_for_cpu
+
+            # Suppress verbose logging from transformers
+            transformers_logging.set_verbosity_error()
+            warnings.filterwarnings("ignore", category=UserWarning, module="transformers")
+            device = get_inference_device()
+            self._analyzer = pipeline("sentiment-analysis", device=device)
+            if device == -1:
+                self._analyzer.model = quantize_for_cpu(self._analyzer.model)
+        return self._analyzer
 
     def score_pain_point_severity(self, text: str):
         """
@@ -34,16 +56,43 @@ class SentimentScorer:
         Returns:
             float: A severity score between 0.0 and 1.0.
         """
-        sentiment = self.sentiment_analyzer(text)[0]
-        base_score = sentiment['score'] if sentiment['label'] == 'NEGATIVE' else 0.1
-
-        # Boost score for intensity words
-        intensity_words = ['extremely', 'really', 'very', 'completely', 'totally', 'hate']
-        intensity_boost = sum(0.1 for word in intensity_words if word in text.lower())
-
-        # Boost score for urgency words
-        urgency_words = ['urgent', 'asap', 'immediately', 'critical', 'emergency', 'need']
-        urgency_boost = sum(0.2 for word in urgency_words if word in text.lower())
-        
-        final_score = min(1.0, base_score + intensity_boost + urgency_boost)
-        return final_score 
\ No newline at end of file
+        return self.score_batch([text])[0]
+
+    def score_batch(self, texts: list, batch_size: int = 32) -> list:
+        """
+        Scores the severity of several pain points with a single pipeline call.
+
+        Args:
+            texts (list): The texts of the pain points to score.
+            batch_size (int, optional): The number of texts the model scores
+                per forward pass. Defaults to 32.
+
+        Returns:
+            list: A severity score between 0.0 and 1.0 for each text, in order.
+        """
+        if not texts:
+            return []
+
+        results = self.sentiment_analyzer(texts, batch_size=batch_size, truncation=True)
+        return [
+            min(1.0, (result['score'] if result['label'] == 'NEGATIVE' else 0.1) + self._keyword_boost(text))
+            for text, result in zip(texts, results)
+        ]
+
+    def _keyword_boost(self, text: str) -> float:
+        """Returns the severity boost for intensity and urgency words in the text."""
+        intensity_words = set()
+        urgency_words = set()
+        for intensity_word, urgency_word in _BOOST_WORDS_RE.findall(text.lower()):
+            if intensity_word:
+                intensity_words.add(intensity_word)
+            else:
+                urgency_words.add(urgency_word)
+        # Each distinct word counts once, however often it is repeated.
+        return 0.1 * len(intensity_words) + 0.2 * len(urgency_words)
+
+
+@functools.lru_cache(maxsize=1)
+def get_sentiment_scorer() -> SentimentScorer:
+    """Returns a SentimentScorer shared by the whole process, so the model is loaded only once."""
+    return SentimentScorer()
@@ -1,14 +1,72 @@
 import yaml
 import os
+import functools
+import pickle
 from dotenv import load_dotenv
 from rich.console import Console
 from rich.syntax import Syntax
 import importlib.resources
 
+# Prefer the LibYAML-backed loader, which is much faster than the pure-Python one.
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from data.database import DB_PATH
 
 console = Console()
 
+# Parsed YAML is cached here so unchanged config files are not re-parsed on every run.
+# It holds the files as written, before environment variables are substituted,
+# so no secrets from the environment are stored.
+CONFIG_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "reddit_saas_finder", "config.pkl")
+
+def _read_config_cache() -> dict:
+    """Returns the cached parsed configs, keyed by file path, or an empty dict."""
+    try:
+        with open(CONFIG_CACHE_PATH, 'rb') as f:
+            cache = pickle.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except Exception:
+        return {}
+
+def _write_config_cache(cache: dict):
+    """Writes the parsed configs to the cache file, readable only by the current user."""
+    try:
+        os.makedirs(os.path.dirname(CONFIG_CACHE_PATH), exist_ok=True)
+        tmp_path = f"{CONFIG_CACHE_PATH}.{os.getpid()}.tmp"
+        with os.fdopen(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), 'wb') as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, CONFIG_CACHE_PATH)
+    except OSError:
+        pass  # The cache is only an optimization
+
+@functools.lru_cache(maxsize=4)
+def _parse_yaml_file(path: str, mtime_ns: int):
+    """Parses a YAML file; cached per (path, mtime), so edits are picked up."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=SafeLoader)
+
+def _expand_env(value):
+    """Returns `value` with environment variables substituted in every string it contains."""
+    if isinstance(value, str):
+        return os.path.expandvars(value)
+    if isinstance(value, dict):
+        return {key: _expand_env(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_expand_env(item) for item in value]
+    return value
+
+def _subreddit_lists(subreddits_config):
+    """Returns the (primary, secondary) subreddit lists from a parsed subreddits config."""
+    if subreddits_config and 'subreddits' in subreddits_config:
+        return (
+            subreddits_config['subreddits'].get('primary', []),
+            subreddits_config['subreddits'].get('secondary', [])
+        )
+    return [], []
+
 class ConfigManager:
     """
     Manages loading and accessing configuration from YAML files and environment variables.
@@ -17,18 +75,39 @@ class ConfigManager:
     def __init__(self):
         """Initializes the ConfigManager."""
         load_dotenv(dotenv_path=".env.local")
+        self._cache = _read_config_cache()
+        self._cache_dirty = False
         self.config = self._load_config("default.yaml")
         self.subreddits_config = self._load_config("subreddits.yaml")
+        if self._cache_dirty:
+            _write_config_cache(self._cache)
 
     def _load_config(self, filename):
         """
         Loads a single YAML configuration file from the package data.
+
+        The parsed file is reused from the on-disk cache while its mtime is
+        unchanged, without reading it. Environment variables are substituted
+        in the loaded values afterwards, so they never reach the cache.
         """
         try:
-            with importlib.resources.files('config').joinpath(filename).open('r') as f:
-                raw_config = f.read()
-                expanded_config = os.path.expandvars(raw_config)
-                return yaml.safe_load(expanded_config)
+            resource = importlib.resources.files('config').joinpath(filename)
+            try:
+                mtime_ns = os.stat(resource).st_mtime_ns
+            except (OSError, TypeError):
+                mtime_ns = None
+            # Keyed by full path, so separate installs sharing the cache file don't collide
+            cache_key = str(resource)
+            cached = self._cache.get(cache_key)
+            if mtime_ns is not None and cached is not None and cached[0] == mtime_ns:
+                parsed = cached[1]
+            else:
+                with resource.open('r') as f:
+                    parsed = yaml.load(f, Loader=SafeLoader)
+                if mtime_ns is not None:
+                    self._cache[cache_key] = (mtime_ns, parsed)
+                    self._cache_dirty = True
+            return _expand_env(parsed)
         except FileNotFoundError:
             console.print(f"[bold red]Error: Configuration file '{filename}' not found in package.[/bold red]")
             return None
@@ -52,6 +131,29 @@ class ConfigManager:
             )
         return None, None, None
 
+    def get_reddit_credential_sets(self):
+        """
+        Retrieves every complete set of Reddit API credentials in the configuration.
+
+        Besides the main credentials, extra OAuth apps can be listed under
+        `reddit.accounts`, each with its own rate limit. An account without a
+        `user_agent` uses the main one.
+
+        Returns:
+            list: A list of (client_id, client_secret, user_agent) tuples, main
+                  credentials first. Incomplete entries are skipped.
+        """
+        client_id, client_secret, user_agent = self.get_reddit_credentials()
+        credential_sets = [(client_id, client_secret, user_agent)]
+        if self.config and 'reddit' in self.config:
+            for account in self.config['reddit'].get('accounts') or []:
+                credential_sets.append((
+                    account.get('client_id'),
+                    account.get('client_secret'),
+                    account.get('user_agent', user_agent)
+                ))
+        return [credentials for credentials in credential_sets if all(credentials)]
+
     def get_database_path(self):
         """
         Returns the configured path to the SQLite database.
@@ -88,36 +190,40 @@ class ConfigManager:
         """
         return self.config.get('scoring', {}) if self.config else {}
 
-    def load_subreddits(self):
+    def load_subreddits(self, path=None):
         """
         Loads the lists of primary and secondary subreddits from the config.
 
+        Args:
+            path (str, optional): A subreddits YAML file to read instead of the
+                packaged one. It is parsed once per modification time, so
+                repeated loads in one process (e.g. from the scheduler) reuse
+                it. Defaults to None.
+
         Returns:
             tuple: A tuple containing two lists: (primary_subreddits, secondary_subreddits).
+
+        Raises:
+            FileNotFoundError: If `path` does not exist.
         """
-        if self.subreddits_config and 'subreddits' in self.subreddits_config:
-            return (
-                self.subreddits_config['subreddits'].get('primary', []),
-                self.subreddits_config['subreddits'].get('secondary', [])
-            )
-        return [], []
+        if path is None:
+            return _subreddit_lists(self.subreddits_config)
+        return _subreddit_lists(_parse_yaml_file(os.path.abspath(path), os.stat(path).st_mtime_ns))
     
     def get_raw_config_text(self):
         """
         Returns the raw text content of the main and subreddit config files.
         """
-        raw_main = ""
-        raw_subreddits = ""
-        try:
-            with importlib.resources.files('config').joinpath('default.yaml').open('r') as f:
-                raw_main = f.read()
-        except FileNotFoundError:
-            pass 
+        texts = []
+        for filename in ("default.yaml", "subreddits.yaml"):
+            try:
+                texts.append(importlib.resources.files('config').joinpath(filename).read_text())
+            except FileNotFoundError:
+                texts.append("")
+        return tuple(texts)
 
-        try:
-            with importlib.resources.files('config').joinpath('subreddits.yaml').open('r') as f:
-                raw_subreddits = f.read()
-        except FileNotFoundError:
-            pass
-        
-        return raw_main, raw_subreddits 
\ No newline at end of file
+
+@functools.lru_cache(maxsize=None)
+def get_config_manager():
+    """Returns a ConfigManager shared by the whole process, created on first use."""
+    return ConfigManager()
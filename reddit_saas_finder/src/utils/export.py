@@ -1,22 +1,53 @@
 """Handles exporting data to various formats and generating reports."""
 import csv
+import gzip
 import json
-import yaml
 import os
 from datetime import datetime
+from itertools import chain
+from operator import attrgetter, itemgetter, length_hint
 from rich.console import Console
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library encoder
+    orjson = None
 
 from data.database import (
-    get_opportunities, 
-    get_pain_points, 
-    get_category_distribution,
+    get_summary_bundle,
     Opportunity,
     PainPoint
 )
 
 console = Console()
 
+def _as_dict(item: Any) -> Dict[str, Any]:
+    """Returns the fields of a data object as a dict, or the item itself if it is already one."""
+    return item.as_dict() if hasattr(item, 'as_dict') else item
+
+def _json_default(value: Any) -> str:
+    """Serializes values the standard JSON encoder can't handle, such as datetimes."""
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+def _encode_json(row: Dict[str, Any]) -> bytes:
+    """Encodes one record as compact JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(row, default=_json_default)
+    return json.dumps(row, default=_json_default).encode('utf-8')
+
+def _with_ndjson_extension(filename: str) -> str:
+    """Replaces a `.yaml`/`.yml` extension with `.ndjson`, keeping any `.gz` suffix."""
+    base, gz = (filename[:-3], '.gz') if filename.endswith('.gz') else (filename, '')
+    root, ext = os.path.splitext(base)
+    if ext.lower() in ('.yaml', '.yml'):
+        base = root
+    return f"{base}.ndjson{gz}"
+
+# YAML is by far the slowest format to write and parse; larger exports are
+# written as line-delimited JSON instead.
+YAML_MAX_ROWS = 10_000
+
 # This is a placeholder until trend analysis is implemented
 def analyze_trends() -> Dict[str, Any]:
     """Mock function for trend analysis."""
@@ -36,8 +67,7 @@ class DataExporter:
                 will be saved. Defaults to "reddit_saas_finder/exports".
         """
         self.export_dir = export_dir
-        if not os.path.exists(self.export_dir):
-            os.makedirs(self.export_dir)
+        os.makedirs(self.export_dir, exist_ok=True)
 
     def _get_filename(self, name: str, format: str) -> str:
         """
@@ -53,34 +83,59 @@ class DataExporter:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         return os.path.join(self.export_dir, f"{name}_{timestamp}.{format}")
 
-    def export_data(self, data: List[Any], data_type: str, format: str, filename: str = None):
+    def export_data(self, data: Iterable[Any], data_type: str, format: str, filename: str = None, compress: bool = False, row_count: Optional[int] = None):
         """
-        Exports a list of data objects to the specified format (CSV, JSON, or YAML).
+        Exports data objects to the specified format (CSV, JSON, NDJSON or YAML).
+
+        The data may be any iterable, including a generator; rows are
+        written as they are produced. Filenames ending in `.gz` are
+        gzip-compressed while they are written. YAML exports of more than
+        `YAML_MAX_ROWS` rows are written as NDJSON instead.
 
         Args:
-            data (List[Any]): A list of data objects (e.g., Opportunity or PainPoint).
+            data (Iterable[Any]): The data objects (e.g., Opportunity or PainPoint) or dictionaries.
             data_type (str): A string representing the type of data (e.g., 'opportunities').
-            format (str): The target format ('csv', 'json', 'yaml').
+            format (str): The target format ('csv', 'json', 'ndjson', 'yaml').
             filename (str, optional): The name of the output file. If not provided,
                 a timestamped name is generated. Defaults to None.
+            compress (bool, optional): Whether to gzip the output, adding a `.gz`
+                suffix to the filename if it lacks one. Defaults to False.
+            row_count (int, optional): The number of rows `data` will produce, for
+                iterables that can't report it themselves. Defaults to None.
         """
+        if row_count is None:
+            row_count = length_hint(data)
+        if format == 'yaml' and row_count > YAML_MAX_ROWS:
+            console.print(
+                f"[bold yellow]{row_count} rows is too many for a YAML export; "
+                f"writing line-delimited JSON (one record per line) instead.[/bold yellow]"
+            )
+            format = 'ndjson'
+            if filename:
+                filename = _with_ndjson_extension(filename)
+
         if not filename:
             filename = self._get_filename(data_type, format)
+        if compress and not filename.endswith('.gz'):
+            filename += '.gz'
 
-        if not data:
+        data_iter = iter(data)
+        first = next(data_iter, None)
+        if first is None:
             console.print(f"[bold yellow]No {data_type} data to export.[/bold yellow]")
             return
 
         try:
-            # Convert data objects to dictionaries for export
-            data_dicts = [item.__dict__ for item in data] if hasattr(data[0], '__dict__') else data
+            items = chain([first], data_iter)
 
             if format == 'csv':
-                self._export_to_csv(data_dicts, filename)
+                self._export_to_csv(items, tuple(_as_dict(first)), filename, from_objects=hasattr(first, 'as_dict'))
             elif format == 'json':
-                self._export_to_json(data_dicts, filename)
+                self._export_to_json(map(_as_dict, items), filename)
+            elif format == 'ndjson':
+                self._export_to_ndjson(map(_as_dict, items), filename)
             elif format == 'yaml':
-                self._export_to_yaml(data_dicts, filename)
+                self._export_to_yaml(map(_as_dict, items), filename)
             else:
                 console.print(f"[bold red]Unsupported format: {format}[/bold red]")
                 return
@@ -89,22 +144,81 @@ class DataExporter:
         except Exception as e:
             console.print(f"[bold red]An error occurred during export: {e}[/bold red]")
 
-    def _export_to_csv(self, data: List[Dict[str, Any]], filename: str):
-        """Helper to export data to a CSV file."""
-        with open(filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
+    def _open_output(self, filename: str, mode: str, **kwargs):
+        """
+        Opens an export file, compressing it on the fly if the name ends in `.gz`.
+
+        Compression level 1 is used, which keeps up with the writers while
+        still shrinking text output several times over.
+
+        Args:
+            filename (str): The path of the output file.
+            mode (str): 'w' for text or 'wb' for binary output.
+            **kwargs: Extra arguments for text mode, such as `encoding` or `newline`.
+
+        Returns:
+            A writable file object.
+        """
+        if filename.endswith('.gz'):
+            return gzip.open(filename, mode if 'b' in mode else 'wt', compresslevel=1, **kwargs)
+        return open(filename, mode, **kwargs)
+
+    def _export_to_csv(self, items: Iterable[Any], fieldnames: tuple, filename: str, from_objects: bool = False):
+        """
+        Helper to export data to a CSV file, one row at a time.
+
+        The column values are pulled out of each item with a single
+        `attrgetter`/`itemgetter` call in the fixed field order, rather than
+        going through a dict per row.
+
+        Args:
+            items (Iterable[Any]): The data objects or dictionaries to write.
+            fieldnames (tuple): The column names, in order.
+            filename (str): The path of the output file.
+            from_objects (bool, optional): Whether the items are data objects
+                rather than dictionaries. Defaults to False.
+        """
+        getter = (attrgetter if from_objects else itemgetter)(*fieldnames)
+        if len(fieldnames) == 1:
+            rows = ((getter(item),) for item in items)
+        else:
+            rows = map(getter, items)
+
+        with self._open_output(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+            writer.writerows(rows)
+
+    def _export_to_json(self, rows: Iterable[Dict[str, Any]], filename: str):
+        """Helper to export data to a JSON array, one record per line, as records are produced."""
+        with self._open_output(filename, 'wb') as f:
+            f.write(b'[')
+            separator = b'\n'
+            for row in rows:
+                f.write(separator)
+                f.write(_encode_json(row))
+                separator = b',\n'
+            f.write(b'\n]\n')
 
-    def _export_to_json(self, data: List[Dict[str, Any]], filename: str):
-        """Helper to export data to a JSON file."""
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+    def _export_to_ndjson(self, rows: Iterable[Dict[str, Any]], filename: str):
+        """Helper to export data as line-delimited JSON, one record per line."""
+        with self._open_output(filename, 'wb') as f:
+            for row in rows:
+                f.write(_encode_json(row))
+                f.write(b'\n')
 
-    def _export_to_yaml(self, data: List[Dict[str, Any]], filename: str):
-        """Helper to export data to a YAML file."""
-        with open(filename, 'w', encoding='utf-8') as f:
-            yaml.dump(data, f, default_flow_style=False)
+    def _export_to_yaml(self, rows: Iterable[Dict[str, Any]], filename: str):
+        """Helper to export data to a YAML list, one record at a time."""
+        # Imported here so that only YAML exports pay for loading PyYAML
+        import yaml
+        # Prefer the LibYAML emitter when PyYAML was built with it
+        SafeDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+        with self._open_output(filename, 'w', encoding='utf-8') as f:
+            # Dumping each record as a one-item list appends it to a single
+            # top-level sequence, the same document a dump of the whole list gives.
+            for row in rows:
+                yaml.dump([row], f, Dumper=SafeDumper, default_flow_style=False)
 
     def generate_report(self, format: str = 'txt', filename: str = None):
         """
@@ -144,18 +258,18 @@ class DataExporter:
             Dict[str, Any]: A dictionary containing summary statistics, top opportunities,
                             category distributions, and trend analysis.
         """
-        top_opportunities = get_opportunities(limit=5)
-        category_dist = get_category_distribution()
+        # The database queries are cached in data.database between saves
+        top_opportunities, opportunity_count, pain_point_count, category_dist = get_summary_bundle(top_limit=5)
         trends = analyze_trends()
-        
+
         return {
             "report_generated_at": datetime.now().isoformat(),
             "summary_stats": {
-                "total_opportunities": len(get_opportunities(limit=1000)),
-                "total_pain_points": len(get_pain_points()),
+                "total_opportunities": opportunity_count,
+                "total_pain_points": pain_point_count,
                 "top_category": category_dist[0][0] if category_dist else "N/A"
             },
-            "top_opportunities": [opp.__dict__ for opp in top_opportunities],
+            "top_opportunities": [opp.as_dict() for opp in top_opportunities],
             "category_distribution": dict(category_dist),
             "trend_analysis": trends
         }
@@ -170,30 +284,27 @@ class DataExporter:
         Returns:
             str: A formatted string containing the full report.
         """
-        report_lines = [
-            "="*50,
-            " Reddit SaaS Opportunity Finder - Summary Report",
-            "="*50,
-            f"Report Generated: {summary['report_generated_at']}\n",
-            "[Summary Statistics]",
-            f"  - Total Opportunities Found: {summary['summary_stats']['total_opportunities']}",
-            f"  - Total Pain Points Detected: {summary['summary_stats']['total_pain_points']}",
-            f"  - Top Category: {summary['summary_stats']['top_category']}\n",
-            "[Top 5 Opportunities]"
-        ]
-        
-        for opp in summary['top_opportunities']:
-            report_lines.append(f"  - ID: {opp['id']}, Title: {opp['title']}, Score: {opp['total_score']:.3f}")
-        report_lines.append("\n")
-        
-        report_lines.append("[Category Distribution]")
-        for category, count in summary['category_distribution'].items():
-            report_lines.append(f"  - {category}: {count}")
-        report_lines.append("\n")
-
-        report_lines.append("[Trend Analysis]")
-        for key, value in summary['trend_analysis'].items():
-            report_lines.append(f"  - {key.replace('_', ' ').title()}: {value}")
-        report_lines.append("\n" + "="*50)
-        
-        return "\n".join(report_lines) 
\ No newline at end of file
+        stats = summary['summary_stats']
+        top_opportunities = summary['top_opportunities']
+        categories = summary['category_distribution'].items()
+        trends = summary['trend_analysis'].items()
+
+        return "\n".join(chain(
+            (
+                "="*50,
+                " Reddit SaaS Opportunity Finder - Summary Report",
+                "="*50,
+                f"Report Generated: {summary['report_generated_at']}\n",
+                "[Summary Statistics]",
+                f"  - Total Opportunities Found: {stats['total_opportunities']}",
+                f"  - Total Pain Points Detected: {stats['total_pain_points']}",
+                f"  - Top Category: {stats['top_category']}\n",
+                "[Top 5 Opportunities]",
+            ),
+            (f"  - ID: {opp['id']}, Title: {opp['title']}, Score: {opp['total_score']:.3f}" for opp in top_opportunities),
+            ("\n", "[Category Distribution]"),
+            (f"  - {category}: {count}" for category, count in categories),
+            ("\n", "[Trend Analysis]"),
+            (f"  - {key.replace('_', ' ').title()}: {value}" for key, value in trends),
+            ("\n" + "="*50,),
+        )) 
\ No newline at end of file
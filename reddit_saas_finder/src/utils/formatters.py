@@ -1 +1,48 @@
-"""Contains data formatting functions.""" 
\ No newline at end of file
+"""Contains data formatting functions."""
+import functools
+import re
+import sys
+
+# Matches Rich console markup tags such as [bold red] and [/bold red].
+_MARKUP_TAG = re.compile(r"\[/?[a-z#@][^\[\]]*\]")
+
+@functools.lru_cache(maxsize=1)
+def get_console():
+    """
+    Returns a Rich console shared by the CLI modules, created on first use.
+
+    Building a console probes the terminal's size, colour support and
+    encoding, so commands that print nothing never pay for it.
+    """
+    from rich.console import Console
+    return Console()
+
+def strip_markup(text: str) -> str:
+    """
+    Removes Rich markup tags from a string.
+
+    Args:
+        text (str): The text, possibly containing tags like `[bold green]`.
+
+    Returns:
+        str: The text without markup tags.
+    """
+    return _MARKUP_TAG.sub("", text)
+
+def echo(*objects, **kwargs):
+    """
+    Prints a status message, styled with Rich only when stdout is a terminal.
+
+    When output is piped or redirected, the markup is stripped and the message
+    is written with the built-in `print`, so scripted runs neither import nor
+    pay for Rich's console rendering.
+
+    Args:
+        *objects: The values to print; strings may contain Rich markup.
+        **kwargs: Extra arguments for `print`, such as `end` or `file`.
+    """
+    if sys.stdout.isatty():
+        from rich import print as rich_print
+        rich_print(*objects, **kwargs)
+    else:
+        print(*(strip_markup(str(obj)) for obj in objects), **kwargs)
@@ -3,6 +3,12 @@ import yaml
 from rich.console import Console
 import os
 
+# Use the LibYAML bindings when PyYAML was built with them.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 KEYWORDS_PATH = "reddit_saas_finder/config/keywords.yaml"
 console = Console()
 
@@ -36,7 +42,7 @@ class KeywordManager:
             self._create_default_keywords_file()
         try:
             with open(self.keywords_path, 'r') as f:
-                return yaml.safe_load(f) or {'pain_point_keywords': []}
+                return yaml.load(f, Loader=SafeLoader) or {'pain_point_keywords': []}
         except yaml.YAMLError as e:
             console.print(f"[bold red]Error parsing keywords file: {e}[/bold red]")
             return {'pain_point_keywords': []}
@@ -45,7 +51,7 @@ class KeywordManager:
         """Saves the current keywords dictionary back to the YAML file."""
         try:
             with open(self.keywords_path, 'w') as f:
-                yaml.dump(self.keywords, f, default_flow_style=False)
+                yaml.dump(self.keywords, f, Dumper=SafeDumper, default_flow_style=False)
             console.print(f"[green]Keywords saved to {self.keywords_path}[/green]")
         except IOError as e:
             console.print(f"[bold red]Error saving keywords file: {e}[/bold red]")
@@ -60,7 +66,7 @@ class KeywordManager:
         try:
             os.makedirs(os.path.dirname(self.keywords_path), exist_ok=True)
             with open(self.keywords_path, 'w') as f:
-                yaml.dump(default_keywords, f)
+                yaml.dump(default_keywords, f, Dumper=SafeDumper)
             console.print(f"Created default keywords file at {self.keywords_path}")
         except IOError as e:
             console.print(f"[bold red]Could not create default keywords file: {e}[/bold red]")
@@ -113,7 +119,7 @@ class KeywordManager:
 
         try:
             with open(file_path, 'w') as f:
-                yaml.dump(self.keywords, f, default_flow_style=False)
+                yaml.dump(self.keywords, f, Dumper=SafeDumper, default_flow_style=False)
             console.print(f"[green]Keywords exported successfully to {file_path}[/green]")
         except IOError as e:
             console.print(f"[bold red]Error exporting keywords to {file_path}: {e}[/bold red]")
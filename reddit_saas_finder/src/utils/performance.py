@@ -1,92 +1,125 @@
 
 import pickle
 import hashlib
+import functools
 import os
 from rich.console import Console
 import cProfile
 import pstats
 import io
-import subprocess
-import sys
+import shlex
+import sqlite3
 
 console = Console()
 CACHE_DIR = "reddit_saas_finder/cache"
 
-def profile_cli_command(command: str):
+def profile_cli_command(command: str, output_path: str = "profile.prof", top: int = 30):
     """
     Profiles a CLI command using cProfile and prints the performance statistics.
 
+    The command runs inside the current process, so the profile covers the
+    command itself rather than the start-up of a second interpreter. The raw
+    stats are also saved for later inspection, e.g. with `snakeviz`.
+
     Args:
         command (str): The command to profile, e.g., "scrape --subreddit tech".
+        output_path (str, optional): Where to save the raw profile data.
+            Defaults to "profile.prof".
+        top (int, optional): The number of functions to list, by cumulative
+            time. Defaults to 30.
     """
+    from cli.main import app
+
     console.print(f"[bold cyan]Profiling command: reddit-finder {command}[/bold cyan]")
-    
-    pr = cProfile.Profile()
-    
-    # It's better to run the command as a subprocess to profile the whole command execution
-    # This requires figuring out the entry point. A simpler way for an integrated tool
-    # is to call the command's function directly. But since we want to profile
-    # the full CLI command including startup, subprocess is better.
-    # We need to find the `reddit-finder` script path.
-    # Assuming it is in the venv/bin.
-    
-    # A simpler approach without finding the script path is to use `sys.executable -m`
-    # but that depends on how the package is installed.
-    # For now, let's assume `reddit-finder` is in the PATH.
-    
-    full_command = f"v/bin/python -m cProfile -o profile.prof -m reddit_saas_finder.src.cli.main {command}"
-    
-    # Since we can't be sure about the environment, we will use a more direct approach
-    # by using subprocess to run the command and cProfile to analyze it.
-    
-    command_to_run = ["venv/bin/reddit-finder"] + command.split()
 
+    pr = cProfile.Profile()
     pr.enable()
     try:
-        # We can't directly profile a subprocess like this.
-        # The profiling needs to happen inside the process being run.
-        # The user's terminal output shows they are running `venv/bin/reddit-finder`.
-        
-        # A better approach:
-        # python -m cProfile -o my_profile.prof my_script.py --args
-        
-        # The entry point is reddit-finder, which is set up in setup.py
-        # and likely points to reddit_saas_finder/src/cli/main.py
-        
-        # Let's use shell=True for simplicity. We must use the 'src' dir as the package root.
-        profile_cmd = [
-            sys.executable,
-            "-m", "cProfile",
-            "-s", "cumulative",
-            "-m", "cli.main",
-        ] + command.split()
-        
-        # We need to run this from the project root directory `reddit_saas_finder`
-        project_root = os.path.join(os.path.dirname(__file__), '..', '..') # this should be reddit_saas_finder
-
-        process = subprocess.run(profile_cmd, cwd=project_root, capture_output=True, text=True, check=True)
-         
-        console.print("[bold green]Profiling complete.[/bold green]")
-        console.print(process.stdout)
-        if process.stderr:
-            console.print("[bold red]Errors during profiling:[/bold red]")
-            console.print(process.stderr)
-
+        # standalone_mode=False makes the CLI return instead of calling sys.exit
+        app(shlex.split(command), prog_name="reddit-finder", standalone_mode=False)
+    except SystemExit:
+        pass
     except Exception as e:
         console.print(f"[bold red]An error occurred during profiling: {e}[/bold red]")
     finally:
         pr.disable()
 
+    pr.dump_stats(output_path)
+    stream = io.StringIO()
+    pstats.Stats(pr, stream=stream).sort_stats("cumulative").print_stats(top)
+    console.print("[bold green]Profiling complete.[/bold green]")
+    console.print(stream.getvalue(), markup=False, highlight=False, soft_wrap=True)
+    console.print(f"Full profile saved to {output_path}")
+
 
 def optimize_database_queries():
     """
-    Optimizes database queries by creating indexes.
+    Optimizes the database for the application's query patterns.
+
+    Makes sure the schema and its indexes are in place, switches the database
+    to write-ahead logging (a setting SQLite persists in the file) and
+    refreshes the statistics the query planner uses to pick indexes.
+    """
+    from data.database import get_db_connection, initialize_database
+
+    conn = get_db_connection()
+    try:
+        initialize_database(conn)
+        journal_mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()[0]
+        conn.execute("ANALYZE")
+        conn.execute("PRAGMA optimize")
+        conn.commit()
+
+        indexes = [row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND name LIKE 'idx_%' ORDER BY name"
+        )]
+        console.print(f"Journal mode: {journal_mode}")
+        console.print(f"Indexes in place: {', '.join(indexes)}")
+        console.print("Query planner statistics refreshed.")
+    except sqlite3.Error as e:
+        console.print(f"[bold red]Database error during optimization: {e}[/bold red]")
+    finally:
+        conn.close()
+
+
+@functools.lru_cache(maxsize=1)
+def get_inference_device() -> int:
+    """
+    Sets up torch for inference and returns the device for Transformers pipelines.
+
+    Torch is told to use every CPU core. This runs once per process.
+
+    Returns:
+        int: 0 if a CUDA GPU is available, otherwise -1 for the CPU.
+    """
+    try:
+        import torch
+    except ImportError:
+        return -1
+    torch.set_num_threads(os.cpu_count() or 1)
+    return 0 if torch.cuda.is_available() else -1
+
+def quantize_for_cpu(model):
+    """
+    Returns `model` with its Linear layers dynamically quantized to int8.
+
+    This roughly halves the weight memory traffic of transformer inference on
+    CPU. The model is returned unchanged if the platform has no quantization
+    engine.
+
+    Args:
+        model (torch.nn.Module): The FP32 model to quantize.
+
+    Returns:
+        torch.nn.Module: The quantized model, or `model` itself.
     """
-    from data.database import initialize_database
-    # This part was not implemented due to issues with file modification.
-    console.print("[bold yellow]Database optimization is not fully implemented yet.[/bold yellow]")
-    console.print("Running basic database initialization to ensure schema and indexes are checked...")
-    initialize_database()
+    import torch
+
+    try:
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    except (RuntimeError, AssertionError):
+        # No quantization engine on this platform; keep the FP32 model.
+        return model
 
 
 class PerformanceOptimizer:
@@ -151,53 +184,32 @@ class PerformanceOptimizer:
         """
         Processes unprocessed posts and comments in batches to conserve memory.
 
-        This method retrieves all unprocessed data and iterates through it in
-        smaller batches, running the pain point detection on each batch.
+        Rows are streamed from the database and run through the advanced
+        detector `batch_size` at a time, so only one batch is held in memory.
+        Sources are selected, analyzed and marked processed exactly as by the
+        `process` command.
 
         Args:
             batch_size (int, optional): The number of items to process in a
                 single batch. Defaults to 100.
         """
-        from data.database import get_unprocessed_posts, get_unprocessed_comments, save_pain_points, get_subreddit_for_post
-        from nlp.pain_detector import AdvancedPainDetector
+        from nlp.pipeline import iter_sources, chunked, extract_batch
+        from data.database import save_pain_points, get_db_connection
+        from nlp.categorizer import Categorizer
+        from nlp.pain_detector import get_pain_detector
 
         console.print(f"Starting batch processing with batch size: {batch_size}")
 
-        pain_detector = AdvancedPainDetector()
-
-        # Process posts
-        unprocessed_posts = get_unprocessed_posts()
-        for i in range(0, len(unprocessed_posts), batch_size):
-            batch = unprocessed_posts[i:i + batch_size]
-            console.log(f"Processing post batch {i//batch_size + 1}...")
-            pain_points = []
-            for post in batch:
-                if post.content:
-                    detected = pain_detector.extract_pain_points(post.content)
-                    for pp in detected:
-                        pp['source_id'] = post.id
-                        pp['source_type'] = 'post'
-                        pp['subreddit'] = post.subreddit
-                    pain_points.extend(detected)
-            if pain_points:
-                save_pain_points(pain_points)
-
-        # Process comments
-        unprocessed_comments = get_unprocessed_comments()
-        for i in range(0, len(unprocessed_comments), batch_size):
-            batch = unprocessed_comments[i:i + batch_size]
-            console.log(f"Processing comment batch {i//batch_size + 1}...")
-            pain_points = []
-            for comment in batch:
-                if comment.content:
-                    detected = pain_detector.extract_pain_points(comment.content)
-                    subreddit = get_subreddit_for_post(comment.post_id)
-                    for pp in detected:
-                        pp['source_id'] = comment.id
-                        pp['source_type'] = 'comment'
-                        pp['subreddit'] = subreddit if subreddit else "unknown"
-                    pain_points.extend(detected)
-            if pain_points:
-                save_pain_points(pain_points)
-        
-        console.print("[bold green]Batch processing complete.[/bold green]") 
\ No newline at end of file
+        detector = get_pain_detector(True)
+        categorizer = Categorizer()
+        seen = {}
+        conn = get_db_connection()
+        try:
+            for batch_number, batch in enumerate(chunked(iter_sources(), batch_size), 1):
+                console.log(f"Processing batch {batch_number}...")
+                pain_points, sources = extract_batch(detector, categorizer, batch, seen)
+                save_pain_points(pain_points, conn, sources)
+        finally:
+            conn.close()
+
+        console.print("[bold green]Batch processing complete.[/bold green]")
\ No newline at end of file
@@ -2,6 +2,8 @@
 import schedule
 import time
 import os
+import logging
+import fcntl
 import signal
 import sys
 from datetime import datetime
@@ -11,6 +13,12 @@ console = Console()
 PID_DIR = "reddit_saas_finder/run"
 PID_FILE = os.path.join(PID_DIR, "scheduler.pid")
 STATUS_FILE = os.path.join(PID_DIR, "scheduler_status.log")
+# The recurring job reports through `logger` into this file; Rich output is
+# kept for the interactive start/stop/status messages.
+LOG_FILE = os.path.join(PID_DIR, "scheduler.log")
+logger = logging.getLogger(__name__)
+# Upper bound on a single sleep, so the loop still wakes up occasionally.
+MAX_SLEEP_SECONDS = 3600
 
 class TaskScheduler:
     """
@@ -22,6 +30,56 @@ class TaskScheduler:
     def __init__(self):
         """Initializes the TaskScheduler, ensuring the run directory exists."""
         os.makedirs(PID_DIR, exist_ok=True)
+        self._lock_file = None
+
+    def _running_pid(self):
+        """
+        Returns the PID of the running scheduler, or None if it is not running.
+
+        The scheduler holds an exclusive `flock` on the PID file for as long as
+        it runs, and the kernel drops the lock when the process exits, so the
+        lock rather than the file's existence tells whether it is running.
+        """
+        try:
+            probe = open(PID_FILE, 'r')
+        except FileNotFoundError:
+            return None
+
+        with probe:
+            try:
+                fcntl.flock(probe, fcntl.LOCK_SH | fcntl.LOCK_NB)
+            except BlockingIOError:
+                content = probe.read().strip()
+                return int(content) if content.isdigit() else None
+            fcntl.flock(probe, fcntl.LOCK_UN)
+            return None
+
+    def _release_lock(self):
+        """Removes the run files and releases the PID file lock held by this process."""
+        if self._lock_file is None:
+            return
+        for path in (PID_FILE, STATUS_FILE):
+            if os.path.exists(path):
+                os.remove(path)
+        self._lock_file.close()
+        self._lock_file = None
+
+    def _write_status(self, payload: str):
+        """
+        Atomically replaces the status file with `payload`.
+
+        The status is written to a temporary file and swapped in with
+        `os.replace`, so `get_status` never reads a half-written file.
+
+        Args:
+            payload (str): The status text to write.
+        """
+        tmp_path = f"{STATUS_FILE}.tmp"
+        with open(tmp_path, "w") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, STATUS_FILE)
 
     def run_scraping_and_processing(self):
         """
@@ -33,18 +91,16 @@ class TaskScheduler:
         """
         from utils.performance import PerformanceOptimizer
         
-        console.log("Scheduler: Running scraping and processing task...")
+        logger.info("Running scraping and processing task...")
         try:
             # Using batch_process_pain_points as it combines scraping and processing
             optimizer = PerformanceOptimizer()
             optimizer.batch_process_pain_points(batch_size=200) # Using a default batch size
-            with open(STATUS_FILE, "w") as f:
-                f.write(f"Last run: {datetime.now().isoformat()}\nStatus: Success")
-            console.log("Scheduler: Task finished successfully.")
+            self._write_status(f"Last run: {datetime.now().isoformat()}\nStatus: Success")
+            logger.info("Task finished successfully.")
         except Exception as e:
-            console.log(f"Scheduler: Task failed with error: {e}")
-            with open(STATUS_FILE, "w") as f:
-                f.write(f"Last run: {datetime.now().isoformat()}\nStatus: Failed\nError: {e}")
+            logger.error("Task failed with error: %s", e)
+            self._write_status(f"Last run: {datetime.now().isoformat()}\nStatus: Failed\nError: {e}")
 
 
     def start(self, interval_hours: int):
@@ -58,43 +114,64 @@ class TaskScheduler:
         Args:
             interval_hours (int): The interval in hours at which to run the task.
         """
-        if os.path.exists(PID_FILE):
+        # Opened without truncating so a running scheduler's PID is not wiped
+        # before we know whether we got the lock.
+        lock_file = open(PID_FILE, 'a+')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
             console.print("[yellow]Scheduler is already running.[/yellow]")
             return
+        self._lock_file = lock_file
 
         # Simple daemonization using os.fork is platform specific.
         # This implementation will run in the foreground but is easily backgrounded by the user (e.g. `... &`)
-        # A PID file is used to manage state for stop/status commands.
+        # The locked PID file is used to manage state for stop/status commands.
         
         pid = os.getpid()
-        with open(PID_FILE, 'w') as f:
-            f.write(str(pid))
+        lock_file.seek(0)
+        lock_file.truncate()
+        lock_file.write(str(pid))
+        lock_file.flush()
+
+        # `stop` sends SIGTERM; exit through the `finally` below so the run files are cleaned up.
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
         
+        log_handler = logging.FileHandler(LOG_FILE)
+        log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        logger.addHandler(log_handler)
+        logger.setLevel(logging.INFO)
+
         console.print(f"[green]Starting scheduler with PID {pid}...[/green]")
-        console.print(f"Scheduling job every {interval_hours} hours.")
+        console.print(f"Scheduling job every {interval_hours} hours. Job output is logged to {LOG_FILE}.")
         
         schedule.every(interval_hours).hours.do(self.run_scraping_and_processing)
 
         try:
             while True:
                 schedule.run_pending()
-                time.sleep(60) # Check every minute
+                # Sleep until the next job is due instead of polling every minute
+                idle = schedule.idle_seconds()
+                if idle is None:
+                    break # No jobs left to run
+                time.sleep(max(1, min(idle, MAX_SLEEP_SECONDS)))
         except KeyboardInterrupt:
             console.print("\n[yellow]Scheduler stopped by user.[/yellow]")
         finally:
-            self.stop()
+            logger.removeHandler(log_handler)
+            log_handler.close()
+            self._release_lock()
     
     def stop(self):
         """
         Stops a running scheduler process by reading its PID and sending a signal.
         """
-        if not os.path.exists(PID_FILE):
+        pid = self._running_pid()
+        if pid is None:
             console.print("[yellow]Scheduler is not running.[/yellow]")
             return
 
-        with open(PID_FILE, 'r') as f:
-            pid = int(f.read())
-
         try:
             os.kill(pid, signal.SIGTERM)
             console.print(f"[green]Sent stop signal to scheduler with PID {pid}.[/green]")
@@ -102,31 +179,19 @@ class TaskScheduler:
             console.print(f"[yellow]Scheduler process with PID {pid} not found. It might have already stopped.[/yellow]")
         except Exception as e:
             console.print(f"[red]Error stopping scheduler: {e}[/red]")
-        finally:
-            os.remove(PID_FILE)
-            if os.path.exists(STATUS_FILE):
-                 os.remove(STATUS_FILE)
 
 
     def get_status(self):
         """
         Checks if the scheduler is running and displays its status.
 
-        It checks for the existence of the PID file and whether the process
-        is active. It also displays the content of the last run's status file.
+        The scheduler is running if another process holds the lock on the PID
+        file. It also displays the content of the last run's status file.
         """
-        if not os.path.exists(PID_FILE):
-            console.print("[bold red]Scheduler is not running.[/bold red]")
-            return
-
-        with open(PID_FILE, 'r') as f:
-            pid = int(f.read())
-
-        try:
-            os.kill(pid, 0) # Check if process exists
-        except OSError:
-            console.print("[yellow]Scheduler PID file found, but process is not running. Cleaning up...[/yellow]")
-            os.remove(PID_FILE)
+        pid = self._running_pid()
+        if pid is None:
+            # An unlocked PID file is left alone: `start` may have just opened it
+            # and not yet taken the lock, and a stale one is harmless.
             console.print("[bold red]Scheduler is not running.[/bold red]")
         else:
             console.print(f"[bold green]Scheduler is running with PID {pid}.[/bold green]")
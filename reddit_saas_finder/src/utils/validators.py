@@ -1,7 +1,7 @@
 """Contains data validation functions."""
 
+import json
 import sqlite3
-import pandas as pd
 from rich.console import Console
 
 console = Console()
@@ -41,28 +41,35 @@ class DataValidator:
                 Defaults to 0.9.
         """
         console.print("[bold cyan]Starting data validation...[/bold cyan]")
-        posts_df = pd.read_sql_query("SELECT * FROM posts", self.conn)
-        comments_df = pd.read_sql_query("SELECT * FROM comments", self.conn)
-
-        total_posts = len(posts_df)
-        total_comments = len(comments_df)
-
-        # Completeness check
-        critical_post_fields = ['id', 'title', 'subreddit', 'created_utc', 'author']
-        missing_posts = posts_df[critical_post_fields].isnull().any(axis=1).sum()
-
-        critical_comment_fields = ['id', 'post_id', 'content', 'created_utc', 'author']
-        missing_comments = comments_df[critical_comment_fields].isnull().any(axis=1).sum()
-
-        # Duplication check (simple check on content)
-        duplicate_posts = posts_df.duplicated(subset=['title', 'content'], keep='first').sum()
-        duplicate_comments = comments_df.duplicated(subset=['content'], keep='first').sum()
-
-        # Spam/Low-quality check (example: very short content or low score)
-        # This can be made more sophisticated.
-        spam_posts = posts_df[(posts_df['content'].str.len() < min_post_length) | (posts_df['score'] < 1)].shape[0]
-        spam_comments = comments_df[(comments_df['content'].str.len() < min_comment_length) | (comments_df['score'] < 1)].shape[0]
-
+        # Every check is counted inside SQLite, in one scan per table (plus a
+        # GROUP BY for duplicates), so no rows are pulled into Python.
+        total_posts, missing_posts, spam_posts, distinct_posts = self.conn.execute(
+            """
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(id IS NULL OR title IS NULL OR subreddit IS NULL OR created_utc IS NULL OR author IS NULL), 0),
+                COALESCE(SUM(COALESCE(LENGTH(content) < ?, 0) OR COALESCE(score < 1, 0)), 0),
+                (SELECT COUNT(*) FROM (SELECT 1 FROM posts GROUP BY title, content))
+            FROM posts
+            """,
+            (min_post_length,),
+        ).fetchone()
+        total_comments, missing_comments, spam_comments, distinct_comments = self.conn.execute(
+            """
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(id IS NULL OR post_id IS NULL OR content IS NULL OR created_utc IS NULL OR author IS NULL), 0),
+                COALESCE(SUM(COALESCE(LENGTH(content) < ?, 0) OR COALESCE(score < 1, 0)), 0),
+                (SELECT COUNT(*) FROM (SELECT 1 FROM comments GROUP BY content))
+            FROM comments
+            """,
+            (min_comment_length,),
+        ).fetchone()
+
+        # Every row beyond the first of each (title, content) or content group
+        # is a duplicate; NULLs group together, as in pandas' duplicated().
+        duplicate_posts = total_posts - distinct_posts
+        duplicate_comments = total_comments - distinct_comments
 
         self.report = {
             "posts": {
@@ -83,6 +90,28 @@ class DataValidator:
         console.print("[bold green]Data validation complete.[/bold green]")
 
 
+    def save_report(self):
+        """
+        Stores the results of the last validation run in the `validation_runs` table.
+        """
+        with self.conn:
+            self.conn.execute("INSERT INTO validation_runs (report) VALUES (?)", (json.dumps(self.report),))
+
+    def load_latest_report(self):
+        """
+        Loads the most recently stored validation results as the current report.
+
+        Returns:
+            str: When the loaded validation ran, or None if none has been stored.
+        """
+        row = self.conn.execute(
+            "SELECT ran_at, report FROM validation_runs ORDER BY id DESC LIMIT 1"
+        ).fetchone()
+        if row is None:
+            return None
+        self.report = json.loads(row[1])
+        return row[0]
+
     def generate_quality_report(self):
         """
         Generates and displays a detailed data quality report in the console.
@@ -0,0 +1,51 @@
+import pytest
+import importlib.resources
+import pickle
+import utils.config as config
+from utils.config import ConfigManager
+
+@pytest.fixture
+def cache_path(tmp_path, monkeypatch):
+    """Points the parsed config cache at a temporary file."""
+    path = tmp_path / "config.pkl"
+    monkeypatch.setattr(config, "CONFIG_CACHE_PATH", str(path))
+    return path
+
+
+def test_config_cache_is_keyed_by_path_and_holds_no_secrets(cache_path, monkeypatch):
+    """The cache holds each file as written, under its full path."""
+    monkeypatch.setenv("REDDIT_CLIENT_SECRET", "s3cr3t-value")
+    manager = ConfigManager()
+
+    assert manager.config['reddit']['client_secret'] == "s3cr3t-value"
+    assert b"s3cr3t-value" not in cache_path.read_bytes()
+    with open(cache_path, 'rb') as f:
+        cache = pickle.load(f)
+    default_path = str(importlib.resources.files('config').joinpath("default.yaml"))
+    assert set(cache) == {default_path, str(importlib.resources.files('config').joinpath("subreddits.yaml"))}
+    assert cache[default_path][1]['reddit']['client_secret'] == "${REDDIT_CLIENT_SECRET}"
+
+
+def test_config_cache_hit_skips_parsing(cache_path, monkeypatch):
+    """An unchanged file is served from the cache, with the current environment substituted."""
+    ConfigManager()
+
+    def no_parse(*args, **kwargs):
+        raise AssertionError("parsed a cached file")
+    monkeypatch.setattr(config.yaml, "load", no_parse)
+    monkeypatch.setenv("REDDIT_CLIENT_ID", "new-id")
+    assert ConfigManager().config['reddit']['client_id'] == "new-id"
+
+
+def test_config_cache_ignores_entries_of_other_installs(cache_path):
+    """An entry under another install's path is never used for this one."""
+    default_path = str(importlib.resources.files('config').joinpath("default.yaml"))
+    mtime_ns = importlib.resources.files('config').joinpath("default.yaml").stat().st_mtime_ns
+    with open(cache_path, 'wb') as f:
+        pickle.dump({"default.yaml": (mtime_ns, {'reddit': {'user_agent': 'other install'}})}, f)
+
+    manager = ConfigManager()
+
+    assert manager.config['reddit']['user_agent'] == "reddit_saas_finder/1.0"
+    with open(cache_path, 'rb') as f:
+        assert default_path in pickle.load(f)
@@ -0,0 +1,157 @@
+import pytest
+import sqlite3
+import data.database as database
+from data.database import (
+    PainPointRow,
+    SCHEMA_VERSION,
+    get_opportunities_rows,
+    get_summary_bundle,
+    initialize_database,
+    save_pain_points,
+    save_posts_and_comments,
+    schema_is_current,
+    use_shared_connection,
+)
+
+@pytest.fixture
+def db_connection():
+    """Create an in-memory SQLite database with the current schema."""
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    initialize_database(conn, quiet=True)
+    conn.executemany(
+        "INSERT INTO posts (id, subreddit, title, content) VALUES (?, ?, ?, ?)",
+        [('p1', 'saas', 'Title one', 'Content one'), ('p2', 'saas', 'Title two', '')]
+    )
+    conn.executemany(
+        "INSERT INTO comments (id, post_id, content) VALUES (?, ?, ?)",
+        [('c1', 'p1', 'A comment.'), ('c2', 'p1', 'Another comment.')]
+    )
+    conn.commit()
+    return conn
+
+@pytest.fixture
+def shared(db_connection):
+    """Makes `db_connection` the shared connection used by the data access functions."""
+    token = database._shared_connection.set(db_connection)
+    database.invalidate_summary_bundle()
+    yield db_connection
+    database._shared_connection.reset(token)
+    database.invalidate_summary_bundle()
+
+def _processed(conn, table):
+    """Returns the IDs of the rows of `table` marked processed."""
+    return {row[0] for row in conn.execute(f"SELECT id FROM {table} WHERE processed = 1")}
+
+def _post(post_id):
+    """Returns a scraped post dictionary as produced by RedditClient."""
+    return {
+        'id': post_id, 'subreddit': 'saas', 'title': 'A title', 'selftext': 'Some text',
+        'author': 'user', 'score': 3, 'num_comments': 1, 'created_utc': 1700000000.0,
+        'url': 'https://example.com', 'link_flair_text': None, 'is_self': True, 'upvote_ratio': 0.9,
+    }
+
+def _comment(comment_id, post_id):
+    """Returns a scraped comment dictionary as produced by RedditClient."""
+    return {
+        'id': comment_id, 'post_id': post_id, 'body': 'A comment body', 'author': 'user',
+        'score': 1, 'created_utc': 1700000100, 'parent_id': f"t3_{post_id}", 'depth': 0,
+        'is_submitter': False,
+    }
+
+
+def test_initialize_database_upgrades_v0_database():
+    """A database from before schema versioning is brought up to date."""
+    conn = sqlite3.connect(":memory:")
+    # The original schema: no user_version, and a full index on `processed`
+    conn.execute("CREATE TABLE posts (id TEXT PRIMARY KEY, subreddit TEXT NOT NULL, title TEXT NOT NULL, content TEXT, author TEXT, score INTEGER, num_comments INTEGER, created_utc TIMESTAMP, scraped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, url TEXT, flair TEXT, is_self BOOLEAN, upvote_ratio REAL, processed BOOLEAN DEFAULT 0)")
+    conn.execute("CREATE INDEX idx_posts_processed ON posts(processed)")
+    conn.execute("INSERT INTO posts (id, subreddit, title) VALUES ('p1', 'saas', 'Kept')")
+    conn.commit()
+    assert not schema_is_current(conn)
+
+    initialize_database(conn, quiet=True)
+
+    assert schema_is_current(conn)
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert {'posts', 'comments', 'pain_points', 'opportunities', 'validation_runs'} <= tables
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert 'idx_posts_unprocessed' in indexes
+    assert 'idx_posts_processed' not in indexes
+    assert conn.execute("SELECT title FROM posts").fetchone()[0] == 'Kept'
+
+    # Running it again on a current database changes nothing
+    initialize_database(conn, quiet=True)
+    assert schema_is_current(conn)
+
+
+def test_save_pain_points_marks_sources_processed(db_connection):
+    """Every analyzed source is marked processed, with or without pain points."""
+    pain_points = [PainPointRow(source_id='p1', source_type='post', content='It is so slow', category='performance')]
+    saved = save_pain_points(pain_points, db_connection, [('post', 'p1'), ('post', 'p2'), ('comment', 'c1')])
+
+    assert saved == 1
+    assert [tuple(row) for row in db_connection.execute("SELECT source_id, category FROM pain_points")] == [("p1", "performance")]
+    assert _processed(db_connection, 'posts') == {'p1', 'p2'}
+    assert _processed(db_connection, 'comments') == {'c1'}
+
+
+def test_save_pain_points_marks_sources_of_empty_batch(db_connection):
+    """A batch without pain points still marks its sources processed."""
+    saved = save_pain_points([], db_connection, [('comment', 'c2')])
+
+    assert saved == 0
+    assert db_connection.execute("SELECT COUNT(*) FROM pain_points").fetchone()[0] == 0
+    assert _processed(db_connection, 'comments') == {'c2'}
+    assert save_pain_points([], db_connection) == 0
+
+
+def test_shared_connection_is_used_by_save_posts_and_comments(tmp_path, monkeypatch):
+    """Data access functions reuse the shared connection instead of opening their own."""
+    with use_shared_connection(str(tmp_path / "reddit_data.db")) as conn:
+        initialize_database(conn, quiet=True)
+
+        def no_new_connection(*args, **kwargs):
+            raise AssertionError("opened a new connection")
+        monkeypatch.setattr(database, "get_db_connection", no_new_connection)
+
+        assert save_posts_and_comments([_post('p1')], [_comment('c1', 'p1')]) == 2
+        # Duplicates are ignored, and the count doesn't include earlier changes
+        assert save_posts_and_comments([_post('p1'), _post('p2')], []) == 1
+
+        # Joins a transaction the shared connection already has open
+        conn.execute("UPDATE posts SET score = 5 WHERE id = 'p1'")
+        assert conn.in_transaction
+        assert save_posts_and_comments([_post('p3')], []) == 1
+
+        assert conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0] == 3
+        assert conn.execute("SELECT created_utc FROM comments").fetchone()[0].startswith("2023-11-1")
+
+    assert database._shared_connection.get() is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+
+
+def test_summary_bundle_is_cached_until_data_is_saved(shared):
+    """The summary is queried once, and again only after pain points are saved."""
+    assert get_summary_bundle()[1:3] == (0, 0)
+
+    shared.execute("INSERT INTO pain_points (source_id, source_type, content) VALUES ('c1', 'comment', 'Added directly')")
+    assert get_summary_bundle()[2] == 0  # Served from the cache
+
+    save_pain_points([PainPointRow(source_id='p1', source_type='post', content='It is so slow')], shared)
+    assert get_summary_bundle()[2] == 2
+
+
+def test_get_opportunities_rows_formats_in_sql(shared):
+    """Rows come back as display strings, best first, with the requested score precision."""
+    shared.executemany(
+        "INSERT INTO opportunities (id, title, description, category, total_score, pain_point_count) VALUES (?, ?, '', ?, ?, ?)",
+        [(1, 'Low', 'finance', 0.25, 3), (2, 'High', None, 2.0 / 3, 12), (3, 'Middle', 'devtools', 0.5, 0)]
+    )
+
+    assert [tuple(row) for row in get_opportunities_rows(limit=2)] == [
+        ('2', 'High', None, '0.667', '12'), ('3', 'Middle', 'devtools', '0.500', '0')
+    ]
+    assert [tuple(row)[3] for row in get_opportunities_rows(score_decimals=2)] == ['0.67', '0.50', '0.25']
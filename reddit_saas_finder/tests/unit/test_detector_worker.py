@@ -0,0 +1,74 @@
+import pytest
+import os
+import sys
+import threading
+import time
+import types
+from multiprocessing.connection import Client
+import nlp.detector_worker as detector_worker
+from nlp.detector_worker import connect_detector, get_key_path, get_socket_path, serve_detector
+
+class FakeDetector:
+    """Reports each text as a pain point, and fails on the text "fail"."""
+    def extract_pain_points_batch(self, texts):
+        if "fail" in texts:
+            raise ValueError("bad batch")
+        return [[{'content': text}] for text in texts]
+
+@pytest.fixture
+def worker(tmp_path, monkeypatch):
+    """Runs a basic detector worker with a fake detector in a background thread."""
+    monkeypatch.setattr(detector_worker, "SOCKET_DIR", str(tmp_path))
+    monkeypatch.setattr(detector_worker, "CONNECT_TIMEOUT_SECONDS", 0.5)
+    fake_module = types.ModuleType("nlp.pain_detector")
+    fake_module.get_pain_detector = lambda advanced: FakeDetector()
+    monkeypatch.setitem(sys.modules, "nlp.pain_detector", fake_module)
+
+    threading.Thread(target=serve_detector, args=(False,), daemon=True).start()
+    for _ in range(100):
+        if os.path.exists(get_socket_path(False)):
+            break
+        time.sleep(0.05)
+    # The thread keeps serving until the tests exit; each test has its own socket
+
+
+def test_worker_detects_and_reports_errors(worker):
+    """Requests are answered by the worker, and a failed batch raises in the client."""
+    assert oct(os.stat(get_key_path(False)).st_mode & 0o777) == '0o600'
+    detector = connect_detector(False)
+    assert detector is not None
+    try:
+        assert detector.extract_pain_points_batch(["slow", "broken"]) == [[{'content': 'slow'}], [{'content': 'broken'}]]
+        with pytest.raises(RuntimeError, match="bad batch"):
+            detector.extract_pain_points_batch(["fail"])
+        # The connection is still usable after an error reply
+        assert detector.extract_pain_points("ok") == [{'content': 'ok'}]
+    finally:
+        detector.conn.close()
+
+
+def test_busy_worker_is_not_waited_on(worker):
+    """A second client gives up after the timeout while the worker serves the first."""
+    first = connect_detector(False)
+    try:
+        assert connect_detector(False) is None
+    finally:
+        first.conn.close()
+    # Served again once the first client has gone
+    second = connect_detector(False)
+    assert second is not None
+    second.conn.close()
+
+
+def test_client_without_key_is_rejected(worker):
+    """A client that doesn't know the key is never sent a reply."""
+    with open(get_key_path(False), 'rb') as f:
+        assert len(f.read()) == 32
+    with pytest.raises(Exception):
+        with Client(get_socket_path(False), family='AF_UNIX', authkey=b'wrong key') as conn:
+            conn.send(["slow"])
+            conn.recv()
+    # The worker keeps serving clients that have the key
+    detector = connect_detector(False)
+    assert detector is not None
+    detector.conn.close()
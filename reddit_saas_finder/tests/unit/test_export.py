@@ -0,0 +1,61 @@
+import pytest
+import gzip
+import json
+from datetime import datetime
+import utils.export as export
+from utils.export import DataExporter
+
+@pytest.fixture
+def exporter(tmp_path):
+    """Create a DataExporter writing to a temporary directory."""
+    return DataExporter(export_dir=str(tmp_path))
+
+@pytest.fixture
+def rows():
+    """Create sample opportunity rows, including a datetime value."""
+    return [
+        {'id': i, 'title': f'Opportunity {i}', 'category': 'finance', 'total_score': i / 10,
+         'created_at': datetime(2024, 1, i + 1, 12, 0)}
+        for i in range(3)
+    ]
+
+def _read_ndjson(lines):
+    """Parses NDJSON lines, skipping blank ones."""
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def test_export_ndjson_round_trip(exporter, rows, tmp_path):
+    """NDJSON exports hold one JSON record per line, streamed from a generator."""
+    path = tmp_path / "opportunities.ndjson"
+    exporter.export_data((row for row in rows), 'opportunities', 'ndjson', str(path))
+
+    records = _read_ndjson(path.read_text().splitlines())
+    assert [record['title'] for record in records] == ['Opportunity 0', 'Opportunity 1', 'Opportunity 2']
+    assert records[1]['created_at'].startswith('2024-01-02T12:00')
+
+
+@pytest.mark.parametrize("format", ["ndjson", "json", "csv"])
+def test_export_compress_round_trip(exporter, rows, tmp_path, format):
+    """--compress adds a .gz suffix and writes a gzip file holding the same export."""
+    path = tmp_path / f"opportunities.{format}"
+    exporter.export_data(rows, 'opportunities', format, str(path), compress=True)
+
+    assert not path.exists()
+    with gzip.open(f"{path}.gz", 'rt') as f:
+        text = f.read()
+    if format == 'ndjson':
+        assert [record['id'] for record in _read_ndjson(text.splitlines())] == [0, 1, 2]
+    elif format == 'json':
+        assert [record['id'] for record in json.loads(text)] == [0, 1, 2]
+    else:
+        assert text.splitlines()[0].split(',')[:2] == ['id', 'title']
+        assert len(text.splitlines()) == 4
+
+
+def test_large_yaml_export_falls_back_to_ndjson(exporter, rows, tmp_path, monkeypatch):
+    """YAML exports over YAML_MAX_ROWS are written as gzipped NDJSON under the matching name."""
+    monkeypatch.setattr(export, "YAML_MAX_ROWS", 2)
+    exporter.export_data(iter(rows), 'opportunities', 'yaml', str(tmp_path / "opportunities.yaml.gz"), row_count=len(rows))
+
+    with gzip.open(tmp_path / "opportunities.ndjson.gz", 'rt') as f:
+        assert len(_read_ndjson(f)) == 3
@@ -0,0 +1,58 @@
+import pytest
+import sys
+import typer
+from typer.core import TyperGroup
+from typer.testing import CliRunner
+from cli.main import app, LAZY_SUBCOMMANDS
+
+runner = CliRunner()
+
+@pytest.fixture
+def group():
+    """Returns the main app's command group with a context to resolve commands in."""
+    command = typer.main.get_command(app)
+    return command, typer.Context(command)
+
+@pytest.fixture
+def unloaded(monkeypatch):
+    """Removes the subcommand modules from sys.modules for the test."""
+    for module_path, _, _ in LAZY_SUBCOMMANDS.values():
+        monkeypatch.delitem(sys.modules, module_path, raising=False)
+
+
+def test_help_lists_subcommands_without_importing_them(unloaded):
+    """--help shows every subcommand with its short help, from placeholders."""
+    result = runner.invoke(app, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ("scrape", "process", "export", "opportunities", "trends"):
+        assert name in result.output
+    assert "Commands for trend detection and analysis." in result.output
+    assert not any(module_path in sys.modules for module_path, _, _ in LAZY_SUBCOMMANDS.values())
+
+
+def test_get_command_resolves_groups_and_functions(group, unloaded):
+    """A Typer sub-app becomes a group and a function a single command, imported on first use."""
+    command, ctx = group
+    trends = command.get_command(ctx, "trends")
+    assert isinstance(trends, TyperGroup)
+    assert trends.name == "trends"
+    assert "cli.trends" in sys.modules
+    # Resolved once, then registered on the group
+    assert command.get_command(ctx, "trends") is trends
+
+    process = command.get_command(ctx, "process")
+    assert not isinstance(process, TyperGroup)
+    assert "--advanced" in [opt for param in process.params for opt in param.opts]
+
+    assert command.get_command(ctx, "no-such-command") is None
+
+
+@pytest.mark.parametrize("name", ["show", "validate", "optimize", "schedule"])
+def test_documented_groups_are_registered(group, name):
+    """The groups documented in the README are listed and dispatch to their Typer apps."""
+    command, ctx = group
+    assert name in command.list_commands(ctx)
+    resolved = command.get_command(ctx, name)
+    assert isinstance(resolved, TyperGroup)
+    assert resolved.list_commands(ctx)
@@ -0,0 +1,20 @@
+import nlp.pipeline as pipeline
+
+class FakeDetector:
+    """Reports one pain point per text."""
+    def extract_pain_points_batch(self, texts):
+        return [[{'content': text, 'confidence': 0.8}] for text in texts]
+
+class FakeCategorizer:
+    """Puts every pain point in one category."""
+    def classify_problem_category(self, text):
+        return 'general'
+
+
+def test_extract_batch_reports_sources_without_text():
+    """Sources with no text skip the detector but are still reported as processed."""
+    batch = [('post', 'p1', 'It keeps crashing', 'saas'), ('comment', 'c1', '', None)]
+    pain_points, processed = pipeline.extract_batch(FakeDetector(), FakeCategorizer(), batch)
+
+    assert [(pp.source_id, pp.subreddit, pp.category) for pp in pain_points] == [('p1', 'saas', 'general')]
+    assert processed == [('post', 'p1'), ('comment', 'c1')]
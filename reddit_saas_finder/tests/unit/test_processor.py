@@ -0,0 +1,80 @@
+import pytest
+import queue
+import sqlite3
+import threading
+import cli.processor as processor
+
+class FakeDetector:
+    """Reports one pain point per text."""
+    def extract_pain_points_batch(self, texts):
+        return [[{'content': text, 'confidence': 0.8}] for text in texts]
+
+class FakeCategorizer:
+    """Puts every pain point in one category."""
+    def classify_problem_category(self, text):
+        return 'general'
+
+@pytest.fixture
+def writer_connection(monkeypatch):
+    """Gives the writer thread an in-memory database instead of the real one."""
+    monkeypatch.setattr(processor, "get_db_connection", lambda: sqlite3.connect(":memory:", check_same_thread=False))
+
+def _fail(*args, **kwargs):
+    """Stands in for a save that fails with a non-database error."""
+    raise RuntimeError("disk full")
+
+
+def test_write_batches_drains_queue_after_error(writer_connection, monkeypatch):
+    """A failing writer records the error and keeps taking batches until the sentinel."""
+    monkeypatch.setattr(processor, "save_pain_points", _fail)
+    batches = queue.Queue(maxsize=2)
+    outcome = {}
+    writer = threading.Thread(target=processor._write_batches, args=(batches, outcome), daemon=True)
+    writer.start()
+
+    # More batches than the queue holds: these puts would block if the writer had died
+    for i in range(10):
+        batches.put(([], [('post', f'p{i}')]), timeout=5)
+    batches.put(None, timeout=5)
+    writer.join(timeout=5)
+
+    assert not writer.is_alive()
+    assert isinstance(outcome['error'], RuntimeError)
+    assert outcome['saved'] == 0
+
+
+def test_process_returns_when_writer_fails(writer_connection, monkeypatch):
+    """process reports the writer's error instead of blocking on the full queue."""
+    sources = [('comment', f'c{i}', f'Text {i}', 'saas') for i in range(processor.BATCH_SIZE * (processor.WRITE_QUEUE_SIZE + 4))]
+    monkeypatch.setattr(processor, "count_unprocessed", lambda: (0, len(sources)))
+    monkeypatch.setattr(processor, "iter_sources", lambda: (source for source in sources))
+    monkeypatch.setattr(processor, "connect_detector", lambda advanced: FakeDetector())
+    monkeypatch.setattr(processor, "Categorizer", FakeCategorizer)
+    monkeypatch.setattr(processor, "save_pain_points", _fail)
+    printed = []
+    monkeypatch.setattr(processor.console, "print", lambda *args, **kwargs: printed.extend(map(str, args)))
+
+    runner = threading.Thread(target=processor.process, kwargs={'advanced': False, 'workers': 1}, daemon=True)
+    runner.start()
+    runner.join(timeout=10)
+
+    assert not runner.is_alive()
+    assert any("disk full" in line for line in printed)
+    assert not any("Successfully" in line for line in printed)
+
+
+def test_process_reports_database_error(writer_connection, monkeypatch):
+    """A database error in the writer is reported, not counted as "no pain points"."""
+    # The writer's database has no pain_points table, so the insert raises OperationalError
+    sources = [('comment', 'c1', 'It keeps crashing', 'saas')]
+    monkeypatch.setattr(processor, "count_unprocessed", lambda: (0, len(sources)))
+    monkeypatch.setattr(processor, "iter_sources", lambda: (source for source in sources))
+    monkeypatch.setattr(processor, "connect_detector", lambda advanced: FakeDetector())
+    monkeypatch.setattr(processor, "Categorizer", FakeCategorizer)
+    printed = []
+    monkeypatch.setattr(processor.console, "print", lambda *args, **kwargs: printed.extend(map(str, args)))
+
+    processor.process(advanced=False, workers=1)
+
+    assert any("no such table: pain_points" in line for line in printed)
+    assert not any("No new pain points" in line or "completed successfully" in line for line in printed)
@@ -0,0 +1,66 @@
+import pytest
+import fcntl
+import os
+import utils.scheduler as scheduler
+from utils.scheduler import TaskScheduler
+
+@pytest.fixture
+def run_dir(tmp_path, monkeypatch):
+    """Points the scheduler's run files at a temporary directory."""
+    monkeypatch.setattr(scheduler, "PID_DIR", str(tmp_path))
+    monkeypatch.setattr(scheduler, "PID_FILE", str(tmp_path / "scheduler.pid"))
+    monkeypatch.setattr(scheduler, "STATUS_FILE", str(tmp_path / "scheduler_status.log"))
+    return tmp_path
+
+@pytest.fixture
+def locked_pid_file(run_dir):
+    """Holds the PID file lock as a running scheduler would, through a separate open file."""
+    with open(run_dir / "scheduler.pid", 'w') as f:
+        f.write("4242")
+        f.flush()
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        yield run_dir / "scheduler.pid"
+
+
+def test_running_pid_without_pid_file(run_dir):
+    """No PID file means no scheduler."""
+    assert TaskScheduler()._running_pid() is None
+
+
+def test_unlocked_pid_file_is_not_running_and_kept(run_dir):
+    """A PID file nobody holds the lock on is stale; status reports it but leaves it alone."""
+    pid_file = run_dir / "scheduler.pid"
+    pid_file.write_text("4242")
+    task_scheduler = TaskScheduler()
+
+    assert task_scheduler._running_pid() is None
+    task_scheduler.get_status()
+    assert pid_file.read_text() == "4242"
+
+
+def test_locked_pid_file_reports_its_pid(locked_pid_file):
+    """The PID in a locked file is the running scheduler's."""
+    assert TaskScheduler()._running_pid() == 4242
+
+
+def test_start_refuses_while_locked(locked_pid_file):
+    """A second start returns at once without wiping the running scheduler's PID."""
+    task_scheduler = TaskScheduler()
+    task_scheduler.start(interval_hours=1)
+
+    assert task_scheduler._lock_file is None
+    assert locked_pid_file.read_text() == "4242"
+
+
+def test_release_lock_removes_run_files(run_dir):
+    """Releasing the lock removes the PID and status files and unlocks."""
+    task_scheduler = TaskScheduler()
+    task_scheduler._lock_file = open(scheduler.PID_FILE, 'a+')
+    fcntl.flock(task_scheduler._lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    task_scheduler._write_status("Last run: now\nStatus: Success")
+
+    task_scheduler._release_lock()
+
+    assert task_scheduler._lock_file is None
+    assert not os.path.exists(scheduler.PID_FILE)
+    assert not os.path.exists(scheduler.STATUS_FILE)
@@ -0,0 +1,20 @@
+import pytest
+from nlp.scorer import SentimentScorer
+
+@pytest.fixture
+def scorer():
+    """Create a SentimentScorer; the model isn't loaded for keyword boosts."""
+    return SentimentScorer()
+
+
+@pytest.mark.parametrize("text, boost", [
+    ("I need this", 0.2),
+    ("It needs fixing and I needed it yesterday", 0.2),
+    ("I hated it, really hated it", 0.2),
+    ("Everyone hates the URGENTLY flagged tickets", 0.3),
+    ("Every time, whatever I do", 0.0),
+    ("Very very urgent, need it asap", 0.1 + 0.6),
+])
+def test_keyword_boost(scorer, text, boost):
+    """Boost words count once each, match with suffixes, and not inside other words."""
+    assert scorer._keyword_boost(text) == pytest.approx(boost)
@@ -0,0 +1,61 @@
+import pytest
+import json
+import sqlite3
+from datetime import datetime, timedelta
+from data.database import initialize_database
+from ml.trend_detector import TrendDetector
+
+@pytest.fixture
+def db_connection():
+    """Create an in-memory SQLite database with the current schema."""
+    conn = sqlite3.connect(":memory:")
+    initialize_database(conn, quiet=True)
+    return conn
+
+def _add_opportunity(conn, opportunity_id, mention_times):
+    """Adds an opportunity whose pain points come from posts created at `mention_times`."""
+    pain_point_ids = []
+    for i, created in enumerate(mention_times):
+        source_id = f"o{opportunity_id}p{i}"
+        conn.execute("INSERT INTO posts (id, subreddit, title, created_utc) VALUES (?, 'saas', 'A title', ?)",
+                     (source_id, created.strftime("%Y-%m-%d %H:%M:%S")))
+        cursor = conn.execute("INSERT INTO pain_points (source_id, source_type, content) VALUES (?, 'post', 'A problem')", (source_id,))
+        pain_point_ids.append(cursor.lastrowid)
+    conn.execute(
+        "INSERT INTO opportunities (id, title, description, category, total_score, pain_point_count, pain_point_ids) VALUES (?, ?, '', 'general', 1.0, ?, ?)",
+        (opportunity_id, f"Opportunity {opportunity_id}", len(pain_point_ids), json.dumps(pain_point_ids))
+    )
+
+
+def test_analyze_opportunity_trends_compares_half_periods(db_connection):
+    """Mentions are counted per half of the window, and old mentions are ignored."""
+    now = datetime.utcnow()
+    early, late, old = now - timedelta(days=25), now - timedelta(days=5), now - timedelta(days=90)
+    _add_opportunity(db_connection, 1, [early, late, late, late])
+    _add_opportunity(db_connection, 2, [early, early, early, late])
+    _add_opportunity(db_connection, 3, [early, early, late, late])
+    _add_opportunity(db_connection, 4, [late])
+    _add_opportunity(db_connection, 5, [old, old, old])
+
+    results = TrendDetector(db_connection).analyze_opportunity_trends(days=30)
+
+    assert [(row['id'], row['trend']) for row in results] == [
+        (1, 'increasing'), (2, 'decreasing'), (3, 'stable'), (4, 'stable'), (5, 'stable')
+    ]
+    assert results[0]['title'] == "Opportunity 1"
+
+
+def test_pain_points_are_dated_by_their_post_or_comment(db_connection):
+    """The source_created view dates pain points from both posts and comments."""
+    db_connection.execute("INSERT INTO posts (id, subreddit, title, created_utc) VALUES ('p1', 'saas', 'A title', '2024-03-02 10:00:00')")
+    db_connection.executemany(
+        "INSERT INTO comments (id, post_id, content, created_utc) VALUES (?, 'p1', 'A comment', ?)",
+        [('c1', '2024-03-20 08:00:00'), ('c2', '2024-07-01 12:00:00'), ('c3', None)]
+    )
+    db_connection.executemany(
+        "INSERT INTO pain_points (source_id, source_type, content) VALUES (?, ?, 'A problem')",
+        # 'c1' as a post matches nothing: sources are joined on their type too
+        [('p1', 'post'), ('c1', 'comment'), ('c2', 'comment'), ('c3', 'comment'), ('c1', 'post')]
+    )
+
+    assert TrendDetector(db_connection).detect_seasonal_patterns() == {'March': 2, 'July': 1}
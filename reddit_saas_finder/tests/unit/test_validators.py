@@ -1,6 +1,7 @@
 import pytest
 import sqlite3
 import pandas as pd
+from data.database import initialize_database
 from utils.validators import DataValidator
 
 @pytest.fixture
@@ -92,4 +93,46 @@ def test_data_validator(db_connection, sample_data):
     assert report['comments']['missing_critical_fields'] == 1 # c2 has null content
     assert report['comments']['duplicates'] == 1 # c4 is a duplicate of c3
     assert report['comments']['spam_or_low_quality'] == 1 # c5 has score < 1
-    assert report['comments']['valid'] == 2 
\ No newline at end of file
+    assert report['comments']['valid'] == 2 
+
+def test_data_validator_null_handling(db_connection):
+    """NULL titles and contents group as duplicates; a NULL length or score is never low quality."""
+    db_connection.executemany(
+        "INSERT INTO posts VALUES (?, ?, 'tech', 'time', 'user', ?, ?, 0)",
+        [
+            ('p1', 'Same Title', None, 5),
+            ('p2', 'Same Title', None, None),  # Duplicate of p1
+            ('p3', None, 'Long enough content here.', 0),  # Missing title, low score
+        ]
+    )
+
+    validator = DataValidator(db_connection)
+    validator.validate_data(min_post_length=10, min_comment_length=10)
+
+    assert validator.report['posts'] == {
+        'total': 3, 'missing_critical_fields': 1, 'duplicates': 1, 'spam_or_low_quality': 1, 'valid': 0
+    }
+    # An empty table counts zero everywhere, not NULL
+    assert validator.report['comments'] == {
+        'total': 0, 'missing_critical_fields': 0, 'duplicates': 0, 'spam_or_low_quality': 0, 'valid': 0
+    }
+
+
+def test_validation_runs_store_the_latest_report():
+    """Saved reports are stored in validation_runs and the newest is loaded back."""
+    conn = sqlite3.connect(":memory:")
+    initialize_database(conn, quiet=True)
+    validator = DataValidator(conn)
+    assert validator.load_latest_report() is None
+
+    validator.validate_data()
+    validator.save_report()
+    conn.execute("INSERT INTO posts (id, subreddit, title, author, created_utc, content, score) VALUES ('p1', 'tech', 'A title', 'user', 'time', 'Some long enough content.', 3)")
+    validator.validate_data()
+    validator.save_report()
+
+    loaded = DataValidator(conn)
+    assert loaded.load_latest_report() is not None
+    assert loaded.report == validator.report
+    assert loaded.report['posts']['valid'] == 1
+    assert conn.execute("SELECT COUNT(*) FROM validation_runs").fetchone()[0] == 2